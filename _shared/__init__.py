@@ -0,0 +1,17 @@
+"""
+_shared
+-------
+
+Description:
+    Helper modules shared by the scripts in this collection.
+
+    Script Runner adds the scripts folder to `sys.path`, so any script run
+    from it can import these helpers, e.g.:
+
+        from _shared.clipboard import copy_to_clipboard
+
+    Folders and files whose names start with an underscore are not listed as
+    categories or scripts, so this package never shows up in the panel.
+    Helpers that change on disk are reloaded before the next run that uses
+    them.
+"""
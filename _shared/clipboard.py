@@ -0,0 +1,16 @@
+"""
+clipboard.py
+------------
+
+Description:
+    Copy text to the system clipboard through Blender's window manager.
+    Works the same on Windows, macOS and Linux, without calling external
+    programs such as `clip`, `pbcopy` or `xclip`.
+"""
+
+import bpy
+
+
+def copy_to_clipboard(text):
+    """Copy text to the system clipboard."""
+    bpy.context.window_manager.clipboard = text
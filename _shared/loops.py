@@ -0,0 +1,121 @@
+"""
+loops.py
+--------
+
+Description:
+    Dissolve edge loops and rings with bmesh, on many meshes at once and
+    without Edit Mode operators.
+
+    Which edges to dissolve is answered by the cached topology index in
+    `_shared.topology`, so running a tool again on an unchanged mesh does
+    not recompute its loops. bmesh only performs the dissolve itself.
+
+Example:
+    from _shared.loops import dissolve_every_nth
+
+    for name, before, after in dissolve_every_nth(bpy.context.selected_objects, 2):
+        print(name, before, "->", after)
+"""
+
+import bmesh
+import bpy
+import numpy as np
+
+from _shared.topology import topology_cache
+from _shared.traversal import unique_data
+
+
+# --------------------------------------------------------------------
+# Dissolving
+# --------------------------------------------------------------------
+
+def dissolve(bm, indices, preserve_boundary=False):
+    """Dissolve the edges at `indices`, removing the vertices left in the
+    middle of edges.
+
+    With `preserve_boundary` vertices on the mesh boundary are kept, so the
+    outline of open meshes does not change.
+    """
+    if not len(indices):
+        return
+    bm.edges.ensure_lookup_table()
+    edges = [bm.edges[i] for i in indices.tolist()]
+    if not preserve_boundary:
+        bmesh.ops.dissolve_edges(bm, edges=edges, use_verts=True, use_face_split=False)
+        return
+
+    verts = {v for e in edges for v in e.verts}
+    bmesh.ops.dissolve_edges(bm, edges=edges, use_verts=False, use_face_split=False)
+    leftover = [
+        v for v in verts if v.is_valid and not v.is_boundary and len(v.link_edges) == 2
+    ]
+    if leftover:
+        bmesh.ops.dissolve_verts(bm, verts=leftover)
+
+
+def selected_edges(mesh):
+    """Indices of the selected edges of `mesh`."""
+    select = np.zeros(len(mesh.edges), dtype=bool)
+    mesh.edges.foreach_get("select", select)
+    return np.nonzero(select)[0]
+
+
+def _edit_meshes(objects, pick, preserve_boundary=False):
+    """Dissolve the edges `pick(mesh, topology)` returns on every unique mesh.
+
+    Edit Mode is left once for all meshes and restored afterwards. Yields
+    `(mesh name, polygons before, polygons after)` for every mesh.
+    """
+    meshes = [data for data in unique_data(objects) if isinstance(data, bpy.types.Mesh)]
+    in_edit_mode = bpy.context.mode == "EDIT_MESH"
+    if in_edit_mode:
+        bpy.ops.object.mode_set(mode="OBJECT")
+    try:
+        for mesh in meshes:
+            before = len(mesh.polygons)
+            indices = pick(mesh, topology_cache.get(mesh))
+            if not len(indices):
+                yield mesh.name, before, before
+                continue
+            bm = bmesh.new()
+            bm.from_mesh(mesh)
+            dissolve(bm, indices, preserve_boundary)
+            bm.to_mesh(mesh)
+            bm.free()
+            mesh.update()
+            yield mesh.name, before, len(mesh.polygons)
+    finally:
+        if in_edit_mode:
+            bpy.ops.object.mode_set(mode="EDIT")
+
+
+def dissolve_every_nth(objects, step=2, offset=0, mode="LOOP", preserve_boundary=False):
+    """Dissolve every `step`-th loop (or ring) of the meshes of `objects`."""
+    return _edit_meshes(
+        objects, lambda mesh, topo: topo.every_nth(step, offset, mode), preserve_boundary
+    )
+
+
+def dissolve_selected_loops(objects, mode="LOOP", preserve_boundary=False):
+    """Dissolve the loops (or rings) through the selected edges of `objects`."""
+    return _edit_meshes(
+        objects,
+        lambda mesh, topo: topo.through(selected_edges(mesh), mode),
+        preserve_boundary,
+    )
+
+
+def dissolve_loops_between(objects, mode="LOOP", preserve_boundary=False):
+    """Dissolve the loops from one selected edge to the other along their ring.
+
+    Meshes that do not have exactly two selected edges on one ring are left
+    unchanged.
+    """
+
+    def pick(mesh, topo):
+        edges = selected_edges(mesh)
+        if len(edges) != 2:
+            return edges[:0]
+        return topo.between(edges[0], edges[1], mode)
+
+    return _edit_meshes(objects, pick, preserve_boundary)
@@ -0,0 +1,129 @@
+"""
+naming.py
+---------
+
+Description:
+    Unique names for bulk renames, without probing Blender in a loop.
+
+    Looking for a free name with `while name in bpy.data.collections` and
+    an increasing suffix gets slower with every collision, and renaming IDs
+    one by one lets Blender add its own `.001` suffixes when a name is still
+    taken by an ID that is about to be renamed too.
+
+    `NameAllocator` reads the names of one ID type (e.g. `bpy.data.objects`)
+    once, remembers the highest numeric suffix used for each base name and
+    hands out the next free name directly (numbers freed by renames are
+    reused first). `rename_all` renames in two
+    phases: every ID first gets a temporary name, then its final one, so no
+    final name is ever blocked by an ID that is being renamed.
+
+Example:
+    from _shared.naming import NameAllocator, rename_all
+
+    names = NameAllocator(bpy.data.objects, separator="_", digits=3)
+    rename_all([(obj, "Tree") for obj in objects], names)
+    # -> Tree, Tree_001, Tree_002, ...
+"""
+
+import heapq
+import re
+
+# Blender stores ID names in 63 bytes (without the type prefix).
+MAX_NAME_BYTES = 63
+
+
+def _fit(base, suffix):
+    """Trim `base` so that `base + suffix` fits in an ID name."""
+    limit = MAX_NAME_BYTES - len(suffix.encode())
+    encoded = base.encode()
+    if len(encoded) > limit:
+        base = encoded[:limit].decode(errors="ignore")
+    return base + suffix
+
+
+class NameAllocator:
+    """Hands out names that are unique among the local IDs of one type."""
+
+    def __init__(self, ids, separator=".", digits=3):
+        self.separator = separator
+        self.digits = digits
+        self._pattern = re.compile(rf"^(.*){re.escape(separator)}(\d+)$")
+        self.used = set()
+        self._next = {}
+        self._released = {}
+        for id_ in ids:
+            if id_.library is None:
+                self.reserve(id_.name)
+
+    def _format(self, base, number):
+        return _fit(base, f"{self.separator}{number:0{self.digits}d}")
+
+    def reserve(self, name):
+        """Mark `name` as taken."""
+        self.used.add(name)
+        match = self._pattern.match(name)
+        if match:
+            base, number = match.group(1), int(match.group(2))
+            if number >= self._next.get(base, 1):
+                self._next[base] = number + 1
+
+    def release(self, name):
+        """Mark `name` as free again (its ID is being renamed)."""
+        self.used.discard(name)
+        match = self._pattern.match(name)
+        if match and len(match.group(2)) == self.digits:
+            heapq.heappush(self._released.setdefault(match.group(1), []), int(match.group(2)))
+
+    def allocate(self, base):
+        """Return `base` if free, otherwise `base` with the next free suffix."""
+        name = _fit(base, "")
+        if name not in self.used:
+            self.reserve(name)
+            return name
+        released = self._released.get(base)
+        while released:
+            name = self._format(base, heapq.heappop(released))
+            if name not in self.used:
+                self.reserve(name)
+                return name
+        number = self._next.get(base, 1)
+        name = self._format(base, number)
+        while name in self.used:
+            number += 1
+            name = self._format(base, number)
+        self._next[base] = number + 1
+        self.reserve(name)
+        return name
+
+
+def rename_all(renames, allocator):
+    """Rename IDs to unique names based on the wanted base names.
+
+    `renames` is a list of `(id, base name)` pairs, handled in order. IDs
+    already named exactly like their base name keep it; the rest first get
+    a temporary name and then their final one. Returns a list of
+    `(id, old name, new name)` for the renamed IDs.
+    """
+    for id_, _ in renames:
+        allocator.release(id_.name)
+
+    # IDs that already carry their base name keep it.
+    keep = set()
+    for index, (id_, base) in enumerate(renames):
+        if id_.name == _fit(base, "") and id_.name not in allocator.used:
+            allocator.reserve(id_.name)
+            keep.add(index)
+
+    planned = [
+        (id_, id_.name, allocator.allocate(base))
+        for index, (id_, base) in enumerate(renames)
+        if index not in keep
+    ]
+    planned = [item for item in planned if item[1] != item[2]]
+
+    for index, (id_, _, _) in enumerate(planned):
+        id_.name = allocator.allocate(f"~rename~{index}")
+    for id_, _, new in planned:
+        allocator.release(id_.name)
+        id_.name = new
+    return planned
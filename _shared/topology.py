@@ -0,0 +1,274 @@
+"""
+topology.py
+-----------
+
+Description:
+    Edge loop and ring queries on meshes, backed by a cached topology index.
+
+    `MeshTopology` reads the mesh once with `foreach_get` into NumPy arrays
+    and derives, per edge end and per edge side:
+        - the face on each side of the edge (edge-face adjacency),
+        - the edge continuing its loop through each vertex,
+        - the edge opposite to it across each quad (its ring neighbours).
+
+    Loops and rings are then labelled once (every edge gets the id of its
+    loop and of its ring) and the loops are numbered along the rings that
+    cross them. After that, questions like "every Nth loop" or "the loops
+    through these edges" are answered with a single array operation.
+
+    `topology_cache` keeps one index per mesh and reuses it as long as the
+    mesh's element counts and edge layout are unchanged, so repeated
+    passes and previews do not rebuild it.
+
+Example:
+    from _shared.topology import topology_cache
+
+    topo = topology_cache.get(mesh)
+    edges = topo.every_nth(step=2)  # edge indices to dissolve
+"""
+
+import zlib
+
+import numpy as np
+
+
+# --------------------------------------------------------------------
+# Reading meshes
+# --------------------------------------------------------------------
+
+def _read(collection, attr, count, dtype=np.int32, width=1):
+    data = np.empty(count * width, dtype=dtype)
+    if count:
+        collection.foreach_get(attr, data)
+    return data.reshape(count, width) if width > 1 else data
+
+
+def read_edge_verts(mesh):
+    return _read(mesh.edges, "vertices", len(mesh.edges), width=2)
+
+
+def mesh_signature(mesh, edge_verts):
+    """Element counts plus a checksum of the edge layout."""
+    return (
+        len(mesh.vertices),
+        len(mesh.edges),
+        len(mesh.loops),
+        len(mesh.polygons),
+        zlib.crc32(edge_verts.tobytes()),
+    )
+
+
+# --------------------------------------------------------------------
+# Topology index
+# --------------------------------------------------------------------
+
+class MeshTopology:
+    """Loop and ring structure of one mesh."""
+
+    def __init__(self, mesh, edge_verts=None):
+        if edge_verts is None:
+            edge_verts = read_edge_verts(mesh)
+        self.signature = mesh_signature(mesh, edge_verts)
+
+        num_verts = len(mesh.vertices)
+        num_edges = len(mesh.edges)
+        num_loops = len(mesh.loops)
+        loop_edge = _read(mesh.loops, "edge_index", num_loops)
+        loop_vert = _read(mesh.loops, "vertex_index", num_loops)
+        loop_start = _read(mesh.polygons, "loop_start", len(mesh.polygons))
+        loop_total = _read(mesh.polygons, "loop_total", len(mesh.polygons))
+
+        edges = np.arange(num_edges)
+        loop_poly = np.repeat(np.arange(len(loop_total)), loop_total)
+        start = loop_start[loop_poly]
+        total = loop_total[loop_poly]
+        local = np.arange(num_loops) - start
+
+        self.edge_verts = edge_verts
+        self.face_count = np.bincount(loop_edge, minlength=num_edges)
+
+        # Faces on both sides of each edge, and the opposite edge across quads
+        order = np.argsort(loop_edge, kind="stable")
+        sorted_edges = loop_edge[order]
+        side = np.arange(num_loops) - np.searchsorted(sorted_edges, sorted_edges)
+        keep = side < 2
+        # Only quad corners have an opposite edge; index just those so the
+        # corners of triangles and n-gons never reach past their face.
+        quads = np.nonzero(total == 4)[0]
+        opposite = np.full(num_loops, -1, dtype=np.int64)
+        opposite[quads] = loop_edge[start[quads] + (local[quads] + 2) % 4]
+        self.edge_faces = np.full((num_edges, 2), -1, dtype=np.int64)
+        self.ring_next = np.full((num_edges, 2), -1, dtype=np.int64)
+        self.edge_faces[sorted_edges[keep], side[keep]] = loop_poly[order][keep]
+        self.ring_next[sorted_edges[keep], side[keep]] = opposite[order][keep]
+        self.ring_next[self.face_count > 2] = -1
+
+        # Loop continuation: at a vertex with 4 edges and 4 face corners the
+        # next edge is the one that shares no corner with the current edge.
+        # Edge ids are summed instead of stored, so the next edge is
+        # "all four edges" minus "this edge" minus "its two corner partners".
+        prev_edge = loop_edge[start + (local - 1) % total]
+        partner_sum = np.zeros((num_edges, 2), dtype=np.int64)
+        partner_count = np.zeros((num_edges, 2), dtype=np.int64)
+        for a, b in ((loop_edge, prev_edge), (prev_edge, loop_edge)):
+            end = (edge_verts[a, 1] == loop_vert).astype(np.int64)
+            np.add.at(partner_sum, (a, end), b)
+            np.add.at(partner_count, (a, end), 1)
+
+        flat = edge_verts.ravel()
+        valence = np.bincount(flat, minlength=num_verts)
+        corners = np.bincount(loop_vert, minlength=num_verts)
+        vert_edge_sum = np.zeros(num_verts, dtype=np.int64)
+        np.add.at(vert_edge_sum, flat, np.repeat(edges, 2))
+        regular = (valence[edge_verts] == 4) & (corners[edge_verts] == 4) & (partner_count == 2)
+        self.loop_next = np.where(
+            regular, vert_edge_sum[edge_verts] - edges[:, None] - partner_sum, -1
+        )
+
+        self._groups = {}
+        self._positions = {}
+
+    # ----------------------------------------------------------------
+    # Walking
+
+    def walk(self, edge, mode="LOOP"):
+        """Edge indices of the loop (or ring) through `edge`, in order."""
+        if mode == "LOOP":
+            links, faces = self.loop_next.tolist(), None
+        else:
+            links, faces = self.ring_next.tolist(), self.edge_faces.tolist()
+        return self._walk(edge, links, faces, self.edge_verts.tolist(), set())
+
+    @staticmethod
+    def _walk(edge, links, faces, verts, seen):
+        """Follow `links` from both sides of `edge`.
+
+        For loops the side is the edge end (a vertex); for rings it is the
+        face on that side of the edge.
+        """
+        seen.add(edge)
+        chain = [edge]
+        for side in (1, 0):
+            part = []
+            current, slot = edge, side
+            while True:
+                following = links[current][slot]
+                if following < 0 or following in seen:
+                    break
+                seen.add(following)
+                part.append(following)
+                if faces is None:
+                    vert = verts[current][slot]
+                    slot = 1 if verts[following][0] == vert else 0
+                else:
+                    face = faces[current][slot]
+                    slot = 1 if faces[following][0] == face else 0
+                current = following
+            chain = chain + part if side == 1 else part[::-1] + chain
+        return chain
+
+    def groups(self, mode="LOOP"):
+        """(label of every edge, ordered edge lists) of all loops or rings."""
+        if mode not in self._groups:
+            if mode == "LOOP":
+                links, faces = self.loop_next.tolist(), None
+            else:
+                links, faces = self.ring_next.tolist(), self.edge_faces.tolist()
+            verts = self.edge_verts.tolist()
+            label = [-1] * len(verts)
+            groups = []
+            for edge in range(len(verts)):
+                if label[edge] >= 0:
+                    continue
+                chain = self._walk(edge, links, faces, verts, set())
+                for e in chain:
+                    if label[e] < 0:
+                        label[e] = len(groups)
+                groups.append(chain)
+            self._groups[mode] = (np.array(label, dtype=np.int64), groups)
+        return self._groups[mode]
+
+    # ----------------------------------------------------------------
+    # Queries
+
+    def positions(self, mode="LOOP"):
+        """Position of every loop (or ring) counted along the crossing rings.
+
+        Neighbouring loops differ by one, so `positions % step` numbers
+        loops the way `select_nth` + `loop_multi_select` would.
+        """
+        if mode not in self._positions:
+            label, units = self.groups(mode)
+            _, sequences = self.groups("RING" if mode == "LOOP" else "LOOP")
+            label = label.tolist()
+            position = [None] * len(units)
+            for sequence in sorted(sequences, key=len, reverse=True):
+                ids = []
+                for edge in sequence:
+                    unit = label[edge]
+                    if not ids or ids[-1] != unit:
+                        ids.append(unit)
+                anchor_index, anchor = next(
+                    ((i, position[u]) for i, u in enumerate(ids) if position[u] is not None),
+                    (0, 0),
+                )
+                for i, unit in enumerate(ids):
+                    if position[unit] is None:
+                        position[unit] = anchor + i - anchor_index
+            self._positions[mode] = np.array(
+                [p if p is not None else 0 for p in position], dtype=np.int64
+            )
+        return self._positions[mode]
+
+    def every_nth(self, step=2, offset=0, mode="LOOP"):
+        """Indices of the inner edges of every `step`-th loop (or ring)."""
+        label, _ = self.groups(mode)
+        picked = self.positions(mode)[label] % step == offset % step
+        return np.nonzero(picked & (self.face_count == 2))[0]
+
+    def through(self, edges, mode="LOOP"):
+        """Indices of the inner edges of the loops (or rings) through `edges`."""
+        label, _ = self.groups(mode)
+        picked = np.isin(label, label[np.asarray(edges, dtype=np.int64)])
+        return np.nonzero(picked & (self.face_count == 2))[0]
+
+    def between(self, first, last, mode="LOOP"):
+        """Inner edges of the loops from `first` to `last` along their ring.
+
+        Returns an empty array when the two edges are not on one ring.
+        """
+        other = "RING" if mode == "LOOP" else "LOOP"
+        ring_label, rings = self.groups(other)
+        if ring_label[first] != ring_label[last]:
+            return np.empty(0, dtype=np.int64)
+        ring = rings[ring_label[first]]
+        a, b = sorted((ring.index(first), ring.index(last)))
+        return self.through(ring[a : b + 1], mode)
+
+
+class TopologyCache:
+    """One `MeshTopology` per mesh, rebuilt only when the mesh changed."""
+
+    def __init__(self):
+        self._cache = {}
+
+    @staticmethod
+    def _key(mesh):
+        return getattr(mesh, "session_uid", None) or mesh.as_pointer()
+
+    def get(self, mesh):
+        edge_verts = read_edge_verts(mesh)
+        topology = self._cache.get(self._key(mesh))
+        if topology is None or topology.signature != mesh_signature(mesh, edge_verts):
+            topology = MeshTopology(mesh, edge_verts)
+            self._cache[self._key(mesh)] = topology
+        return topology
+
+    def invalidate(self, mesh=None):
+        if mesh is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(self._key(mesh), None)
+
+
+topology_cache = TopologyCache()
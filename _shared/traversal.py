@@ -0,0 +1,97 @@
+"""
+traversal.py
+------------
+
+Description:
+    Walk the data used by a set of objects, visiting everything only once.
+
+    Scripts that loop over `obj.data.materials` for every selected object
+    process shared meshes and materials again for each object that uses
+    them, and never look inside node groups. These helpers yield each
+    unique datablock, material and node tree exactly once, and descend into
+    group nodes with protection against groups that contain themselves.
+
+Example:
+    from _shared.traversal import iter_nodes, unique_materials
+
+    for tree, node in iter_nodes(unique_materials(bpy.context.selected_objects)):
+        if node.type == "TEX_IMAGE":
+            node.width = 400
+"""
+
+
+def unique_data(objects):
+    """Yield the data (mesh, curve, ...) of `objects` once per datablock."""
+    seen = set()
+    for obj in objects:
+        data = obj.data
+        if data is None or data.as_pointer() in seen:
+            continue
+        seen.add(data.as_pointer())
+        yield data
+
+
+def unique_materials(objects):
+    """Yield every material used by `objects` once.
+
+    Covers materials linked to the object data as well as materials linked
+    to the objects themselves.
+    """
+    seen = set()
+
+    def new(mat):
+        if mat is None or mat.as_pointer() in seen:
+            return False
+        seen.add(mat.as_pointer())
+        return True
+
+    data_seen = set()
+    for obj in objects:
+        data = obj.data
+        if data is not None and hasattr(data, "materials"):
+            if data.as_pointer() not in data_seen:
+                data_seen.add(data.as_pointer())
+                for mat in data.materials:
+                    if new(mat):
+                        yield mat
+        for slot in obj.material_slots:
+            if slot.link == "OBJECT" and new(slot.material):
+                yield slot.material
+
+
+def walk_node_tree(tree, seen=None):
+    """Yield `tree` and every node group nested in it, each once.
+
+    `seen` holds the pointers of trees already visited; pass the same set
+    to several calls to share it between them.
+    """
+    if seen is None:
+        seen = set()
+    stack = [tree]
+    while stack:
+        tree = stack.pop()
+        if tree is None or tree.as_pointer() in seen:
+            continue
+        seen.add(tree.as_pointer())
+        yield tree
+        for node in tree.nodes:
+            if node.type == "GROUP" and node.node_tree is not None:
+                stack.append(node.node_tree)
+
+
+def unique_node_trees(owners):
+    """Yield the node trees of materials (or worlds, lights...) once each,
+    including nested node groups.
+    """
+    seen = set()
+    for owner in owners:
+        if getattr(owner, "use_nodes", True) and owner.node_tree is not None:
+            yield from walk_node_tree(owner.node_tree, seen)
+
+
+def iter_nodes(owners, node_type=None):
+    """Yield `(tree, node)` for every node of every unique tree of `owners`."""
+    for tree in unique_node_trees(owners):
+        for node in tree.nodes:
+            if node_type is None or node.type == node_type:
+                yield tree, node
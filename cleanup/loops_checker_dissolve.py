@@ -3,27 +3,45 @@ Dissolve Every Nth Edge Loop
 loops_checker_dissolve.py
 ----------------------------
 
-This script automates the process of reducing mesh edge loops by selecting and dissolving
-every second edge in Edit Mode. It is useful for simplifying meshes while maintaining
-overall shape and topology.
+This script reduces mesh edge loops by dissolving every Nth edge loop (every
+second one by default) of all selected meshes in one pass. It is useful for
+simplifying meshes while maintaining overall shape and topology.
 
 Steps performed:
-    1. Ensures the active object is a mesh and switches to Edit Mode.
-    2. Selects every 2nd edge in the mesh (using `mesh.select_nth(2)`).
-    3. Expands the selection to full loops (using `loop_multi_select`).
-    4. Dissolves the selected edge loops (using `mesh.dissolve_edges`).
+    1. Collects the meshes of all selected objects (shared meshes once).
+    2. Numbers the edge loops along the rings crossing them, using the
+       cached topology index of each mesh (`_shared.topology`).
+    3. Dissolves every STEP-th loop with bmesh, keeping the vertices on
+       open boundaries (PRESERVE_BOUNDARY).
+    4. Prints the polygon count of each mesh before and after.
 
 Usage:
-    - Select a mesh object.
-    - Run the script in the Scripting editor.
-    - The script will simplify the mesh by dissolving alternating edge loops.
+    - Select one or more mesh objects (Object or Edit Mode).
+    - Adjust STEP, OFFSET, MODE and PRESERVE_BOUNDARY below if needed.
+    - Run the script from Script Runner (it uses the shared `_shared.loops`
+      helper).
+
+Notes:
+    - No Edit Mode operators are used, so hundreds of meshes are cleaned up
+      in one go instead of one mode switch and undo step each.
+    - MODE = "RING" dissolves every Nth ring instead of every Nth loop.
 """
 
 import bpy
 
-if bpy.context.mode != "EDIT_MESH":
-    raise Exception("You must be in Edit Mode on a mesh.")
+from _shared.loops import dissolve_every_nth
+
+STEP = 2  # Dissolve every Nth loop
+OFFSET = 0  # Which of the N loops to dissolve (0 .. STEP - 1)
+MODE = "LOOP"  # "LOOP" or "RING"
+PRESERVE_BOUNDARY = True  # Keep the vertices on open boundaries
+
+total_before = total_after = 0
+for name, before, after in dissolve_every_nth(
+    bpy.context.selected_objects, STEP, OFFSET, MODE, PRESERVE_BOUNDARY
+):
+    print(f"{name}: {before} -> {after} polygons")
+    total_before += before
+    total_after += after
 
-bpy.ops.mesh.select_nth(2)
-bpy.ops.mesh.loop_multi_select(ring=False)
-bpy.ops.mesh.dissolve_edges()
+print(f"Total: {total_before} -> {total_after} polygons")
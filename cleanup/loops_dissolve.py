@@ -7,23 +7,22 @@ This script dissolves the edge loops based on the user’s current edge selectio
 It is useful for quickly cleaning up geometry while preserving the surface shape.
 
 Steps performed:
-    1. Ensures the active object is a mesh and switches to Edit Mode.
-    2. Expands the current edge selection into full loops (using `loop_multi_select`).
-    3. Dissolves the selected edge loops (using `mesh.dissolve_edges`).
+    1. Collects the meshes of all selected objects (shared meshes once).
+    2. Expands the selected edges of each mesh into full loops with bmesh.
+    3. Dissolves those loops and prints the polygon counts before and after.
 
 Usage:
-    - Select a mesh object.
-    - In Edit Mode, select one or more edges you want to dissolve loops through.
-    - Run the script in the Scripting editor.
+    - Select one or more mesh objects.
+    - In Edit Mode, select one or more edges you want to dissolve loops through
+      (on any number of objects).
+    - Run the script from Script Runner (it uses the shared `_shared.loops`
+      helper).
     - The loops corresponding to the selected edges will be dissolved.
 """
 
 import bpy
 
-# Ensure we are in Edit Mode
-obj = bpy.context.object
-if obj and obj.type == "MESH":
-    bpy.ops.object.mode_set(mode="EDIT")
-    bpy.ops.mesh.loop_multi_select(ring=False)
-    # Dissolve all selected edge loops
-    bpy.ops.mesh.dissolve_edges()
+from _shared.loops import dissolve_selected_loops
+
+for name, before, after in dissolve_selected_loops(bpy.context.selected_objects):
+    print(f"{name}: {before} -> {after} polygons")
@@ -0,0 +1,200 @@
+"""
+Dissolve Every Nth Loop (Operator)
+loops_nth_dissolve_operator.py
+------------------------------
+
+Registers a "Dissolve Every Nth Loop" operator with a redo panel, so the step
+can be tuned interactively instead of editing and rerunning
+`loops_checker_dissolve.py`.
+
+Redo panel options:
+    * Step              – dissolve every Nth loop.
+    * Offset            – which of the N loops to dissolve.
+    * Mode              – dissolve loops or rings.
+    * Preserve Boundary – keep the vertices on open boundaries.
+
+How it works:
+    - When the operator is started, the original geometry of every selected
+      mesh is kept as a bmesh snapshot, and its loops and rings are indexed
+      once (`_shared.topology`).
+    - Each change in the redo panel starts again from that snapshot and only
+      recomputes which edges to dissolve, so tweaking the step on a
+      million-polygon mesh stays interactive.
+    - A snapshot is only reused while the mesh is unchanged. Repeat Last or
+      a call from a script after editing the mesh works on the current
+      geometry and never brings back an older one.
+    - Works on all selected meshes, in Object or Edit Mode.
+
+Usage:
+    1. Run this script from Script Runner (it uses the shared `_shared`
+       helpers) to register the operator.
+    2. Select the meshes, then use Object > Clean Up > Dissolve Every Nth Loop
+       (or Edge > Dissolve Every Nth Loop in Edit Mode), or search for it
+       with F3.
+    3. Adjust the options in the redo panel in the bottom left corner.
+"""
+
+import uuid
+import zlib
+
+import bmesh
+import bpy
+import numpy as np
+from bpy.types import Operator
+
+from _shared.loops import dissolve
+from _shared.topology import mesh_signature, read_edge_verts, topology_cache
+from _shared.traversal import unique_data
+
+
+class DissolveSession:
+    """Original geometry of the meshes for one redo chain of the operator.
+
+    Each run started from the UI (or called without a session token) opens
+    a new session. A snapshot is only used while the mesh still matches it
+    exactly (topology and vertex positions), which is the case when the
+    undo system restored the original before a redo. Any other mesh is
+    taken as a new original, so geometry the snapshot does not know about
+    is never overwritten.
+    """
+
+    def __init__(self):
+        self.token = ""
+        self.snapshots = {}
+
+    def clear(self):
+        for bm, _ in self.snapshots.values():
+            bm.free()
+        self.snapshots = {}
+
+    def start(self):
+        """Open a new session and return its token."""
+        self.clear()
+        self.token = uuid.uuid4().hex
+        return self.token
+
+    @staticmethod
+    def signature(mesh):
+        coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        if len(coords):
+            mesh.vertices.foreach_get("co", coords)
+        return (mesh_signature(mesh, read_edge_verts(mesh)), zlib.crc32(coords.tobytes()))
+
+    def original(self, mesh):
+        """bmesh copy of the original geometry of `mesh` in this session."""
+        key = mesh.session_uid if hasattr(mesh, "session_uid") else mesh.as_pointer()
+        signature = self.signature(mesh)
+        snapshot = self.snapshots.get(key)
+        if snapshot is not None and snapshot[1] == signature:
+            return snapshot[0]
+        if snapshot is not None:
+            snapshot[0].free()
+        bm = bmesh.new()
+        bm.from_mesh(mesh)
+        self.snapshots[key] = (bm, signature)
+        return bm
+
+
+dissolve_session = DissolveSession()
+
+
+class MESH_OT_dissolve_nth_loops(Operator):
+    """Dissolve every Nth edge loop of the selected meshes"""
+
+    bl_idname = "mesh.dissolve_nth_loops"
+    bl_label = "Dissolve Every Nth Loop"
+    bl_options = {"REGISTER", "UNDO"}
+
+    step: bpy.props.IntProperty(
+        name="Step", description="Dissolve every Nth loop", default=2, min=2, max=64
+    )
+
+    offset: bpy.props.IntProperty(
+        name="Offset", description="Which of the N loops to dissolve", default=0, min=0
+    )
+
+    mode: bpy.props.EnumProperty(
+        name="Mode",
+        items=[
+            ("LOOP", "Loops", "Dissolve edge loops"),
+            ("RING", "Rings", "Dissolve edge rings"),
+        ],
+        default="LOOP",
+    )
+
+    preserve_boundary: bpy.props.BoolProperty(
+        name="Preserve Boundary",
+        description="Keep the vertices on open boundaries",
+        default=True,
+    )
+
+    session: bpy.props.StringProperty(options={"HIDDEN", "SKIP_SAVE"})
+
+    @classmethod
+    def poll(cls, context):
+        return any(obj.type == "MESH" for obj in context.selected_objects)
+
+    def invoke(self, context, event):
+        # A fresh start: forget the snapshots of the previous run.
+        self.session = ""
+        return self.execute(context)
+
+    def execute(self, context):
+        meshes = [
+            data
+            for data in unique_data(context.selected_objects)
+            if isinstance(data, bpy.types.Mesh)
+        ]
+        in_edit_mode = context.mode == "EDIT_MESH"
+        if in_edit_mode:
+            bpy.ops.object.mode_set(mode="OBJECT")
+
+        # Redo keeps the token of its first run; anything else starts over.
+        if not self.session or self.session != dissolve_session.token:
+            self.session = dissolve_session.start()
+
+        total_before = total_after = 0
+        for mesh in meshes:
+            snapshot = dissolve_session.original(mesh)
+            topology = topology_cache.get(mesh)
+
+            before = len(snapshot.faces)
+            indices = topology.every_nth(self.step, self.offset, self.mode)
+            if len(indices):
+                bm = snapshot.copy()
+                dissolve(bm, indices, self.preserve_boundary)
+                bm.to_mesh(mesh)
+                bm.free()
+                mesh.update()
+            total_before += before
+            total_after += len(mesh.polygons)
+
+        if in_edit_mode:
+            bpy.ops.object.mode_set(mode="EDIT")
+
+        self.report(
+            {"INFO"},
+            f"{len(meshes)} mesh(es): {total_before} -> {total_after} polygons",
+        )
+        return {"FINISHED"}
+
+
+def menu_func(self, context):
+    self.layout.operator(MESH_OT_dissolve_nth_loops.bl_idname)
+
+
+def register():
+    bpy.utils.register_class(MESH_OT_dissolve_nth_loops)
+    bpy.types.VIEW3D_MT_object_cleanup.append(menu_func)
+    bpy.types.VIEW3D_MT_edit_mesh_edges.append(menu_func)
+
+
+def unregister():
+    bpy.types.VIEW3D_MT_object_cleanup.remove(menu_func)
+    bpy.types.VIEW3D_MT_edit_mesh_edges.remove(menu_func)
+    bpy.utils.unregister_class(MESH_OT_dissolve_nth_loops)
+    dissolve_session.clear()
+
+
+if __name__ == "__main__":
+    register()
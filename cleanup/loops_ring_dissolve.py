@@ -7,27 +7,27 @@ This script dissolves edge loops located between two user-selected edges.
 It is useful for cleaning up dense geometry while maintaining topology continuity.
 
 Steps performed:
-    1. Ensures the active object is a mesh in Edit Mode; otherwise, raises an exception.
-    2. Switches to EDGE selection mode.
-    3. Uses `shortest_path_select` to select all edges between the first and second selected edge.
-    4. Expands the selection to complete edge loops (`loop_multi_select`).
-    5. Dissolves the selected loops (`mesh.dissolve_edges`).
+    1. Collects the meshes of all selected objects (shared meshes once).
+    2. Finds the ring that runs through both selected edges of each mesh.
+    3. Dissolves every loop crossing that ring from the first selected edge
+       to the second, both included.
+    4. Prints the polygon count of each mesh before and after.
 
 Usage:
-    - Enter Edit Mode on a mesh.
-    - Select exactly two edges that mark the range of loops you want removed.
-    - Run the script in the Scripting editor.
+    - Enter Edit Mode on one or more meshes.
+    - Select exactly two edges per mesh that mark the range of loops you
+      want removed. Both edges must lie on the same ring.
+    - Run the script from Script Runner (it uses the shared `_shared.loops`
+      helper).
     - All edge loops between the two selected edges will be dissolved.
 """
 
 import bpy
 
-if bpy.context.mode != "EDIT_MESH":
-    raise Exception("You must be in Edit Mode on a mesh.")
+from _shared.loops import dissolve_loops_between
 
-bpy.ops.mesh.select_mode(type="EDGE")
-bpy.ops.mesh.shortest_path_select(
-    use_face_step=True, use_topology_distance=True, use_fill=False
-)
-bpy.ops.mesh.loop_multi_select(ring=False)
-bpy.ops.mesh.dissolve_edges()
+for name, before, after in dissolve_loops_between(bpy.context.selected_objects):
+    if before == after:
+        print(f"{name}: skipped, select two edges on one ring")
+    else:
+        print(f"{name}: {before} -> {after} polygons")
@@ -11,16 +11,16 @@ Description:
 
 Usage:
     1. In the 3‑D Viewport, select one or more objects.
-    2. Open the **Text Editor**, load this script (or paste it into a new
-    text block).
-    3. Press **Run Script** (or hit `Alt+P`).
+    2. Run the script from Script Runner.
 
 Notes:
     * If several selected objects share the same collection, the script
     renames that collection only once (the first time it is encountered).
     * If a collection with the desired name already exists, the script
     automatically appends a numeric suffix (`_1`, `_2`, …) so the name
-    stays unique.
+    stays unique. Free names come from the shared `_shared.naming`
+    allocator and all collections are renamed in one pass, so thousands of
+    collections are renamed in linear time. Run it from Script Runner.
     * The script only considers the first collection in
     `object.users_collection`.  If an object belongs to multiple
     collections and you wish to rename all of them, modify the loop
@@ -29,6 +29,8 @@ Notes:
 
 import bpy
 
+from _shared.naming import NameAllocator, rename_all
+
 
 def rename_parent_collections():
     """Rename the first collection of each selected object to that object's name."""
@@ -38,43 +40,22 @@ def rename_parent_collections():
         print("Nothing selected – nothing to do.")
         return
 
-    # Keep track of collections that were already renamed in this run
-    renamed_collections = set()
-
+    # Pick one object per collection (the first one encountered)
+    renames = {}
     for obj in selected_objects:
         # An object may belong to multiple collections.
         # We'll rename the first one we find.
         if not obj.users_collection:
             print(f"Object '{obj.name}' is not in any collection – skipping.")
             continue
+        renames.setdefault(obj.users_collection[0], obj)
 
-        parent_col = obj.users_collection[0]
-
-        # Skip if we've already renamed this collection (possible when objects share a collection)
-        if parent_col in renamed_collections:
-            continue
-
-        # Desired new name is the object's name
-        desired_name = obj.name
-
-        # Ensure the name is unique inside bpy.data.collections
-        if (
-            desired_name in bpy.data.collections
-            and bpy.data.collections[desired_name] is not parent_col
-        ):
-            base_name = desired_name
-            suffix = 1
-            while desired_name in bpy.data.collections:
-                desired_name = f"{base_name}_{suffix}"
-                suffix += 1
-
-        # Rename and remember
-        parent_col.name = desired_name
-        renamed_collections.add(parent_col)
+    # Rename all collections at once, with unique names
+    names = NameAllocator(bpy.data.collections, separator="_", digits=0)
+    renamed = rename_all([(col, obj.name) for col, obj in renames.items()], names)
 
-        print(
-            f"Renamed collection '{parent_col.name}' to '{desired_name}' for object '{obj.name}'."
-        )
+    for col, old_name, new_name in renamed:
+        print(f"Renamed collection '{old_name}' to '{new_name}' for object '{renames[col].name}'.")
 
 
 rename_parent_collections()
@@ -13,13 +13,16 @@ Features:
     - Skips renaming if the object already has the target name.
     - If multiple selected objects are in the same collection, appends suffixes
       "_001", "_002", etc.
+    - Names come from the shared `_shared.naming` allocator and all objects
+      are renamed in one pass (through temporary names), so Blender never
+      adds its own ".001" suffixes and thousands of objects are renamed in
+      linear time.
     - Renames both the object and its data block (for meshes and curves) to keep
       them consistent.
 
 Usage:
     1. Select the objects you want to rename.
-    2. Run the script from Blender's Text Editor or assign it to a custom
-       button.
+    2. Run the script from Script Runner.
     3. Objects will be renamed according to their collection name.
 
 Example:
@@ -30,42 +33,34 @@ Example:
 """
 
 import bpy
-from collections import defaultdict
 
+from _shared.naming import NameAllocator, rename_all
 
-def rename_selected_to_collection():
-    # Dictionary: collection_name -> list of objects in that collection
-    col_objects = defaultdict(list)
-
-    # Gather selected objects grouped by their first collection
-    for obj in bpy.context.selected_objects:
-        if obj.users_collection:
-            collection_name = obj.users_collection[0].name
-            col_objects[collection_name].append(obj)
-
-    # Rename in groups
-    for collection_name, objs in col_objects.items():
-        counter = 1
-        for obj in objs:
-            # Target name (without suffix for first object)
-            if counter == 1:
-                new_name = collection_name
-            else:
-                new_name = f"{collection_name}_{counter:03d}"
+DATA_TYPES = {"MESH": "meshes", "CURVE": "curves"}
 
-            # Skip if object already matches desired name
-            if obj.name == new_name:
-                counter += 1
-                continue
 
-            # Rename object
-            obj.name = new_name
-
-            # Rename its data if it has one and type is Mesh or Curve
-            if obj.type in {"MESH", "CURVE"} and obj.data:
-                obj.data.name = new_name
-
-            counter += 1
+def rename_selected_to_collection():
+    # Gather selected objects grouped by their first collection, in order
+    renames = [
+        (obj, obj.users_collection[0].name)
+        for obj in bpy.context.selected_objects
+        if obj.users_collection
+    ]
+
+    # Rename all objects in one pass: Tree, Tree_001, Tree_002, ...
+    objects = NameAllocator(bpy.data.objects, separator="_", digits=3)
+    rename_all(renames, objects)
+
+    # Rename their data if they have one and type is Mesh or Curve
+    # (shared data is renamed once, after its first object)
+    for obj_type, attr in DATA_TYPES.items():
+        data_renames = {}
+        for obj, _ in renames:
+            if obj.type == obj_type and obj.data:
+                data_renames.setdefault(obj.data, obj.name)
+        if data_renames:
+            names = NameAllocator(getattr(bpy.data, attr), separator="_", digits=3)
+            rename_all(list(data_renames.items()), names)
 
 
 rename_selected_to_collection()
@@ -10,22 +10,24 @@ Description:
 
 Usage:
     1. In Blender, select the objects you want to move to new collections.
-    2. Open the Text Editor, load this script, and run it (Alt+P).
+    2. Run the script from Script Runner (it uses the shared
+       `_shared.reorganize` helper).
     3. Each selected object will now have its own collection with the same name.
 
 Notes:
-    - Existing collections with the same name will be replaced if created anew.
+    - Existing collections with the same name are reused.
     - Works with any object type (mesh, curve, light, etc.).
+    - All moves are planned first and applied in one pass; set DRY_RUN = True
+      to only print the plan.
 """
 
 import bpy
 
+from _shared.reorganize import CollectionPlan
 
-for obj in bpy.context.selected_objects:
-    col = bpy.data.collections.new(name=obj.name)
-    bpy.context.scene.collection.children.link(col)
+DRY_RUN = False  # Only print what would change
 
-    for other_col in obj.users_collection:
-        other_col.objects.unlink(obj)
-    if obj.name not in col.objects:
-        col.objects.link(obj)
+plan = CollectionPlan(bpy.context.scene.collection)
+for obj in bpy.context.selected_objects:
+    plan.assign(obj, obj.name)
+plan.apply(dry_run=DRY_RUN)
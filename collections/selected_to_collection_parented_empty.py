@@ -12,7 +12,8 @@ Description:
 
 Usage:
     1. In Blender, select one or more mesh objects.
-    2. Open the Text Editor, load this script, and run it (Alt+P).
+    2. Run the script from Script Runner (it uses the shared
+       `_shared.reorganize` helper).
     3. Each mesh will be parented to an Empty in a new or existing collection
        named after the mesh.
 
@@ -20,10 +21,17 @@ Notes:
     - Only mesh objects are processed; other object types are ignored.
     - Existing Empties and collections with the same name are reused.
     - Parenting preserves world transforms.
+    - Collection moves are planned first and applied in one pass at the end.
+    - Set DRY_RUN = True to only print what would be done; no Empties are
+      created and nothing is reparented.
 """
 
 import bpy
 
+from _shared.reorganize import CollectionPlan
+
+DRY_RUN = False  # Only print what would be done, without changing the scene
+
 
 def selected_to_collection_parented_empty():
     selected_meshes = [
@@ -34,6 +42,7 @@ def selected_to_collection_parented_empty():
         print("No mesh objects selected.")
         return
 
+    plan = CollectionPlan(bpy.context.scene.collection)
     for obj in selected_meshes:
         empty_name = obj.name
 
@@ -43,30 +52,28 @@ def selected_to_collection_parented_empty():
             and bpy.data.objects[empty_name].type == "EMPTY"
         ):
             empty = bpy.data.objects[empty_name]
+        elif DRY_RUN:
+            empty = None
+            print(f"  + empty {empty_name}, parent of {obj.name}")
         else:
             empty = bpy.data.objects.new(name=empty_name, object_data=None)
             empty.matrix_world = obj.matrix_world.copy()
             bpy.context.scene.collection.objects.link(empty)
 
         # Parent mesh to Empty if not already
-        if obj.parent != empty:
-            obj.parent = empty
-            obj.matrix_parent_inverse = empty.matrix_world.inverted()
-
-        # Create or get collection with the object's name
-        if empty_name not in bpy.data.collections:
-            new_collection = bpy.data.collections.new(empty_name)
-            bpy.context.scene.collection.children.link(new_collection)
-        else:
-            new_collection = bpy.data.collections[empty_name]
+        if empty is not None and obj.parent != empty:
+            if DRY_RUN:
+                print(f"  {obj.name} parented to {empty.name}")
+            else:
+                obj.parent = empty
+                obj.matrix_parent_inverse = empty.matrix_world.inverted()
 
-        # Move both objects into the new collection if not already there
-        for o in [obj, empty]:
-            if o.name not in new_collection.objects:
-                for coll in o.users_collection:
-                    coll.objects.unlink(o)
-                new_collection.objects.link(o)
+        # Both objects go into a collection named after the mesh
+        plan.assign(obj, empty_name)
+        if empty is not None:
+            plan.assign(empty, empty_name)
 
+    plan.apply(dry_run=DRY_RUN)
     print("Done: All selected mesh objects processed.")
 
 
@@ -5,8 +5,11 @@ create_material_palette_from_selected.py
 Purpose:
     * Scans all selected mesh objects in the current Blender scene.
     * Collects every unique material from those objects.
-    * Creates one UV sphere per unique material and assigns that material.
+    * Creates one UV sphere object per unique material and assigns that
+      material. All spheres share one mesh; the material is linked to the
+      object, not the mesh.
     * Arranges the spheres into a 2D grid (rows × columns), spaced evenly.
+    * Puts the spheres in a new "Material Palette" collection.
     * Places the grid at the location of the first selected object.
 
 Usage:
@@ -28,13 +31,43 @@ Customization:
 Notes:
     * The script deselects all objects before creating spheres, then selects
       all the new ones.
+    * Objects are created directly with `bpy.data.objects.new` instead of
+      calling an operator per sphere, so a palette of thousands of materials
+      builds in well under a second and uses the memory of a single mesh.
     * You can easily move or group the entire palette since they are all selected.
 """
 
 import math
 from mathutils import Vector
+import bmesh
 import bpy
 
+PALETTE_COLLECTION = "Material Palette"
+
+
+def create_sphere_mesh(segments: int, rings: int, radius: float):
+    """One UV sphere mesh with a single material slot, shared by all spheres."""
+    mesh = bpy.data.meshes.new("MaterialPaletteSphere")
+    bm = bmesh.new()
+    bmesh.ops.create_uvsphere(bm, u_segments=segments, v_segments=rings, radius=radius)
+    for face in bm.faces:
+        face.smooth = True
+    bm.to_mesh(mesh)
+    bm.free()
+    mesh.materials.append(None)
+    return mesh
+
+
+def grid_offsets(count: int, spacing: float, autogrid: bool):
+    """Offsets of every sphere, computed in one pass."""
+    if not autogrid:
+        return [Vector((idx * spacing, 0, 0)) for idx in range(count)]
+    cols = math.ceil(math.sqrt(count))  # square grid layout
+    return [
+        Vector(((idx % cols) * spacing, (idx // cols) * spacing, 0))
+        for idx in range(count)
+    ]
+
 
 def create_material_spheres_grid(
     segments: int,
@@ -63,46 +96,34 @@ def create_material_spheres_grid(
         print("No materials found in selected objects.")
         return
 
-    # Deselect all first
-    bpy.ops.object.select_all(action="DESELECT")
-    created_spheres = []
-
-    num_materials = len(unique_materials)
-    cols = math.ceil(math.sqrt(num_materials))  # square grid layout
+    materials = sorted(unique_materials, key=lambda mat: mat.name)
 
-    for idx, mat in enumerate(unique_materials):
-        row = idx // cols
-        col = idx % cols
-
-        if autogrid:
-            offset = Vector((col * spacing, row * spacing, 0))
-        else:
-            offset = Vector((idx * spacing, 0, 0))
-
-        location = base_location + offset
+    # Deselect all first
+    for obj in selected_objects:
+        obj.select_set(False)
 
-        bpy.ops.mesh.primitive_uv_sphere_add(
-            segments=segments, ring_count=rings, radius=radius, location=location
-        )
-        sphere = bpy.context.active_object
+    collection = bpy.data.collections.new(PALETTE_COLLECTION)
+    bpy.context.scene.collection.children.link(collection)
 
-        if prefix == "":
-            sphere.name = f"{mat.name}"
-        else:
-            sphere.name = f"{prefix}_{mat.name}"
+    mesh = create_sphere_mesh(segments, rings, radius)
+    offsets = grid_offsets(len(materials), spacing, autogrid)
+    created_spheres = []
 
-        if sphere.data.materials:
-            sphere.data.materials[0] = mat
-        else:
-            sphere.data.materials.append(mat)
+    for mat, offset in zip(materials, offsets):
+        name = mat.name if prefix == "" else f"{prefix}_{mat.name}"
+        sphere = bpy.data.objects.new(name, mesh)
+        sphere.location = base_location + offset
+        collection.objects.link(sphere)
 
-        created_spheres.append(sphere)
+        # The material lives on the object, so all spheres share one mesh
+        slot = sphere.material_slots[0]
+        slot.link = "OBJECT"
+        slot.material = mat
 
-    for sphere in created_spheres:
         sphere.select_set(True)
+        created_spheres.append(sphere)
 
-    if created_spheres:
-        bpy.context.view_layer.objects.active = created_spheres[0]
+    bpy.context.view_layer.objects.active = created_spheres[0]
 
     print(
         f"Created and selected {len(created_spheres)} material spheres near first selected object."
@@ -9,26 +9,33 @@ Description:
 
 Usage:
     1. Select one or more objects in the 3D Viewport.
-    2. Open the Script in Blender's Text Editor.
-    3. Click 'Run Script'.
+    2. Run this script from Script Runner (it uses the shared
+       `_shared.traversal` helper).
 
 Details:
+    - Object data shared by several selected objects is cleared only once.
     - If an object has no materials, it will be skipped.
     - If an object type does not support materials (e.g., Empty, Camera), it will be skipped.
-    - Outputs a log in the console indicating which objects had materials removed.
+    - Outputs a log in the console indicating which data had materials removed.
 """
 
 import bpy
 
-# Loop through all selected objects
-for obj in bpy.context.selected_objects:
-    if hasattr(obj.data, "materials"):  # Only objects with material slots
-        mat_count = len(obj.data.materials)
-        if mat_count > 0:
-            # Clear all material slots
-            obj.data.materials.clear()
-            print(f"Removed {mat_count} materials from: {obj.name}")
-        else:
-            print(f"No materials found on: {obj.name}")
-    else:
+from _shared.traversal import unique_data
+
+selected = bpy.context.selected_objects
+
+for obj in selected:
+    if obj.data is None or not hasattr(obj.data, "materials"):
         print(f"Object type '{obj.type}' does not support materials: {obj.name}")
+
+for data in unique_data(selected):
+    if not hasattr(data, "materials"):
+        continue
+    mat_count = len(data.materials)
+    if mat_count > 0:
+        # Clear all material slots
+        data.materials.clear()
+        print(f"Removed {mat_count} materials from: {data.name}")
+    else:
+        print(f"No materials found on: {data.name}")
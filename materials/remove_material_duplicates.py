@@ -3,53 +3,226 @@ remove_material_duplicates.py
 -----------------------------
 
 Description:
-    This script scans all materials in the current .blend file and identifies
-    duplicate materials created by Blender's automatic naming convention
-    (e.g. "Material", "Material.001", "Material.002", etc.).
+    This script scans all materials in the current .blend file, finds
+    materials that are structurally identical and merges each group of
+    duplicates into one material.
+
+    Materials are compared by a content hash, not by name, so "Wood" and
+    "Kitbash_Mat_0042" are merged when they are the same, while
+    "Material" and "Material.001" are kept apart when they differ.
 
 It performs the following steps:
-    1. Detects "original" materials (without numeric suffix) and maps them
-    to their duplicates (with .001, .002, etc.).
-    2. Replaces all occurrences of duplicate materials in all objects
-       across all scenes with their corresponding original material.
-    3. Purges unused duplicate materials using Blender's Orphan Data Purge.
+    1. Hashes every local material: all of its settings (viewport display,
+       blend and shadow modes, backface culling, pass index, Grease Pencil
+       stroke and fill style, etc.) and its node tree (node types, node settings, unlinked input values, the
+       constants of Value and RGB nodes, how the nodes are wired, image
+       references and the contents of nested node groups). Names, labels,
+       node locations and reroutes are ignored.
+    2. Groups materials with equal hashes and keeps one per group,
+       preferring a name without a numeric suffix (.001, .002, etc.).
+    3. Remaps every user of each duplicate to the kept material in one
+       call with `ID.user_remap`, then deletes the duplicate.
 
 Usage:
     - Open the script in Blender's Text Editor.
     - Press Alt+P to run.
     - All duplicate materials will be replaced and removed automatically.
+    - Set DRY_RUN = True to only print the groups that would be merged.
 
 Note:
-    - Only duplicates with numeric suffixes (.001, .002, etc.) are handled.
-    - If the suffix-free original material does not exist, duplicates will be skipped.
+    - Materials linked from other .blend files are never merged.
+    - Only the merged duplicates are removed; other orphan data is left alone.
 """
 
-import bpy
+import hashlib
 import re
 
+import bpy
+
 # --- CONFIG ---
+DRY_RUN = False
+FLOAT_DIGITS = 5  # Float values are rounded before hashing
 suffix_pattern = re.compile(r"\.\d{3}$")  # Matches .001, .002, etc.
 
-# Step 1: Map base material name → original material
-base_to_original = {}
-for mat in bpy.data.materials:
-    base_name = suffix_pattern.sub("", mat.name)
-    # Pick the first one without a suffix as "original"
-    if not suffix_pattern.search(mat.name):
-        base_to_original[base_name] = mat
-
-# Step 2: Replace duplicates with original materials
-for obj in bpy.data.objects:
-    if not hasattr(obj.data, "materials"):
-        continue
-    for slot_index, mat in enumerate(obj.data.materials):
-        if not mat:
+# Settings shared by every node; they do not change what the node does.
+NODE_BASE_PROPS = {prop.identifier for prop in bpy.types.ShaderNode.bl_rna.properties}
+# Material settings that are bookkeeping, UI state or hashed separately.
+MATERIAL_SKIP_PROPS = {prop.identifier for prop in bpy.types.ID.bl_rna.properties} | {
+    "rna_type",
+    "node_tree",
+    "preview",
+    "animation_data",
+    "paint_active_slot",
+    "paint_clone_slot",
+}
+# Nested settings structs that are compared field by field.
+MATERIAL_NESTED_PROPS = {"grease_pencil", "lineart", "cycles"}
+
+
+def _value(value):
+    """Hashable, rounded form of an RNA value."""
+    if isinstance(value, float):
+        return round(value, FLOAT_DIGITS)
+    if isinstance(value, (bool, int, str)) or value is None:
+        return value
+    if isinstance(value, bpy.types.Image):
+        return ("IMAGE", value.source, bpy.path.abspath(value.filepath) or value.name)
+    if isinstance(value, bpy.types.ColorRamp):
+        return (
+            value.interpolation,
+            tuple((_value(e.position), _value(tuple(e.color))) for e in value.elements),
+        )
+    if isinstance(value, bpy.types.CurveMapping):
+        return tuple(
+            tuple((_value(tuple(p.location)), p.handle_type) for p in curve.points)
+            for curve in value.curves
+        )
+    if isinstance(value, bpy.types.ID):
+        return (type(value).__name__, value.name)
+    if isinstance(value, bpy.types.bpy_struct):
+        # Other nested structs (e.g. image users) are not compared.
+        return type(value).__name__
+    try:
+        return tuple(_value(v) for v in value)
+    except TypeError:
+        return repr(value)
+
+
+def rna_signature(struct, skip, tree_hash, nested=()):
+    """`(name, value)` of every property of `struct` not in `skip`.
+
+    Node groups are replaced by their tree hash and the structs named in
+    `nested` are walked the same way.
+    """
+    props = []
+    for prop in struct.bl_rna.properties:
+        name = prop.identifier
+        if name in skip or name == "rna_type" or prop.type == "COLLECTION":
             continue
-        base_name = suffix_pattern.sub("", mat.name)
-        if base_name in base_to_original and mat != base_to_original[base_name]:
-            obj.data.materials[slot_index] = base_to_original[base_name]
+        value = getattr(struct, name, None)
+        if name == "node_tree":
+            props.append((name, tree_hash(value) if value else None))
+        elif name in nested:
+            props.append((name, rna_signature(value, (), tree_hash) if value else None))
+        else:
+            props.append((name, _value(value)))
+    return tuple(props)
+
+
+def node_signature(node, tree_hash):
+    """Everything about a node that affects the shading result."""
+    props = rna_signature(node, NODE_BASE_PROPS, tree_hash)
+
+    inputs = tuple(
+        (sock.identifier, _value(sock.default_value))
+        for sock in node.inputs
+        if not sock.is_linked and hasattr(sock, "default_value")
+    )
+    # Value and RGB nodes (and other nodes without inputs) keep their
+    # constant on the output socket.
+    outputs = ()
+    if not node.inputs or node.type in {"VALUE", "RGB"}:
+        outputs = tuple(
+            (sock.identifier, _value(sock.default_value))
+            for sock in node.outputs
+            if hasattr(sock, "default_value")
+        )
+    return (node.bl_idname, node.mute, props, inputs, outputs)
+
+
+class MaterialHasher:
+    """Structural hashes of materials, with node groups hashed once."""
 
-# Step 3: Remove unused materials
-bpy.ops.outliner.orphans_purge(do_local_ids=True, do_linked_ids=True, do_recursive=True)
+    def __init__(self):
+        self.trees = {}
+
+    def tree_hash(self, tree):
+        key = tree.as_pointer()
+        if key in self.trees:
+            # None marks a group that is still being hashed (a cycle).
+            return self.trees[key] or "CYCLE"
+        self.trees[key] = None
+
+        incoming = {}
+        for link in tree.links:
+            if link.is_valid and not getattr(link, "is_muted", False):
+                incoming.setdefault(link.to_node.name, []).append(link)
+
+        node_keys = {}
+
+        def node_key(node):
+            """Hash of a node and of everything upstream of it.
+
+            Identical nodes wired differently get different keys, so the
+            links are part of the digest. Reroutes are looked through.
+            """
+            if node.name in node_keys:
+                return node_keys[node.name] or "CYCLE"
+            node_keys[node.name] = None
+            sources = sorted(
+                (link.to_socket.identifier,) + upstream(link)
+                for link in incoming.get(node.name, ())
+            )
+            signature = node_signature(node, self.tree_hash)
+            result = hashlib.sha1(repr((signature, sources)).encode()).hexdigest()
+            node_keys[node.name] = result
+            return result
+
+        def upstream(link):
+            """(node key, socket) a link really comes from, past reroutes."""
+            seen = set()
+            while link.from_node.type == "REROUTE" and link.from_node.name not in seen:
+                seen.add(link.from_node.name)
+                feeding = incoming.get(link.from_node.name)
+                if not feeding:
+                    return ("REROUTE", "")
+                link = feeding[0]
+            return (node_key(link.from_node), link.from_socket.identifier)
+
+        keys = sorted(
+            node_key(node) for node in tree.nodes if node.type not in {"FRAME", "REROUTE"}
+        )
+        digest = hashlib.sha1(repr(keys).encode()).hexdigest()
+        self.trees[key] = digest
+        return digest
+
+    def material_hash(self, mat):
+        # Every setting, including the Grease Pencil stroke and fill style.
+        settings = rna_signature(
+            mat, MATERIAL_SKIP_PROPS, self.tree_hash, MATERIAL_NESTED_PROPS
+        )
+        tree = mat.node_tree if mat.use_nodes else None
+        return (settings, self.tree_hash(tree) if tree else None)
+
+
+def keep_priority(mat):
+    """Sort key: prefer names without a numeric suffix, then the shortest."""
+    return (bool(suffix_pattern.search(mat.name)), len(mat.name), mat.name)
+
+
+# Step 1: Group local materials by content hash
+hasher = MaterialHasher()
+groups = {}
+for mat in bpy.data.materials:
+    if mat.library is None:
+        groups.setdefault(hasher.material_hash(mat), []).append(mat)
+
+# Step 2 & 3: Remap duplicates to the kept material and remove them
+merged = 0
+for mats in groups.values():
+    if len(mats) < 2:
+        continue
+    mats.sort(key=keep_priority)
+    keep, duplicates = mats[0], mats[1:]
+    print(f"{keep.name} <- {', '.join(m.name for m in duplicates)}")
+    if DRY_RUN:
+        continue
+    for dup in duplicates:
+        dup.user_remap(keep)
+        bpy.data.materials.remove(dup)
+        merged += 1
 
-print("✅ Duplicate materials replaced and purged.")
+if DRY_RUN:
+    print("Dry run: nothing was changed.")
+else:
+    print(f"✅ Merged {merged} duplicate material(s).")
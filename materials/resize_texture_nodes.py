@@ -8,35 +8,33 @@ Description:
     materials, making them easier to locate in the Shader Editor.
 
 How it works:
-    * Loops over every selected object.
-    * For each object that has materials, it checks every material slot.
-    * If a material uses nodes, it scans its node‑tree.
+    * Collects the materials of every selected object, each material once,
+      even when it is shared by many objects or meshes.
+    * Walks each material's node‑tree, including nested node groups (every
+      group is visited once).
     * Every node of type `TEX_IMAGE` is set to a width of 400 pixels.
     * The node is optionally selected for quick visual identification.
 
 Typical usage:
     1. Select the objects you want to process in the 3D Viewport.
-    2. Open this script in Blender’s Text Editor.
-    3. Press **Alt + P** (or click *Run Script*).
+    2. Run this script from Script Runner (it uses the shared
+       `_shared.traversal` helper).
 
 Feel free to adjust the width value or the selection logic to suit your workflow.
 """
 
 import bpy
 
+from _shared.traversal import iter_nodes, unique_materials
+
 NODE_WIDTH = 400
 
-# Loop through all selected objects
-for obj in bpy.context.selected_objects:
-    # Ensure the object has materials
-    if not hasattr(obj.data, "materials"):
-        continue
-
-    # Loop through all material slots
-    for mat in obj.data.materials:
-        if mat and mat.use_nodes:
-            nodes = mat.node_tree.nodes
-            for node in nodes:
-                if node.type == "TEX_IMAGE":
-                    node.width = NODE_WIDTH
-                    # node.select = True  # Optional: highlight
+materials = unique_materials(bpy.context.selected_objects)
+
+resized = 0
+for tree, node in iter_nodes(materials, "TEX_IMAGE"):
+    node.width = NODE_WIDTH
+    # node.select = True  # Optional: highlight
+    resized += 1
+
+print(f"Resized {resized} image texture node(s).")
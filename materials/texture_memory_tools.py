@@ -0,0 +1,527 @@
+"""
+texture_memory_tools.py
+-----------------------
+
+Description:
+    This Blender add-on adds a "Texture Memory" panel to the 3D Viewport
+    sidebar (N-panel) that allows you to:
+        - List every image used by the materials of the selection or the
+          whole scene, with its resolution, channels and estimated RAM and
+          GPU footprint, sorted by cost.
+        - Generate downscaled proxy images (half, quarter or eighth size)
+          from the source files in a pool of background Blender processes.
+        - Swap the image nodes to the proxies, and revert with one click.
+
+Usage:
+    1. Install this file as an add-on, or run it from the Text Editor (Alt+P).
+    2. Open the 3D Viewport sidebar ("N") and go to the "Tool" tab.
+    3. In the "Texture Memory" panel choose Selection or Scene and press
+       "Report" to see the most expensive images.
+    4. Choose a proxy size and press "Use Proxies". Proxies are written to a
+       "proxies" folder next to the .blend file (or next to the source
+       image if the file is not saved yet) and reused on later runs. Their
+       names carry a short hash of the source path, so textures with the
+       same file name in different folders do not share a proxy.
+    5. Press "Revert" to put the original images back.
+
+How it works:
+    - Image nodes are found in the materials' node trees, including nested
+      node groups, and in the world.
+    - Memory is estimated from the image size: 4 channels in RAM (float
+      images use 4 bytes per channel), half floats on the GPU, plus a third
+      for mipmaps.
+    - Proxies are made by running this file in headless Blender workers:
+      `blender -b --factory-startup --python texture_memory_tools.py -- proxy
+      <source> <proxy> <width> <height>`. Several run in parallel.
+    - Each proxy image remembers its original in the "proxy_source" custom
+      property. The original gets a fake user so it survives saving while
+      unused, and its pixels are freed from memory.
+
+Notes:
+    - Packed and generated images have no source file and are skipped.
+    - The workers run this file again, so it has to exist on disk: install it
+      as an add-on or run it with Script Runner rather than from an unsaved
+      text block.
+    - Proxies are regular images, so they are saved with the .blend file;
+      revert before handing the file over if the proxies should not ship.
+"""
+
+import hashlib
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import bpy
+from bpy.types import Operator, Panel
+
+
+bl_info = {
+    "name": "Texture Memory Tools",
+    "author": "Your Name",
+    "version": (1, 0, 0),
+    "blender": (3, 0, 0),
+    "location": "View3D > Sidebar > Tool Tab > Texture Memory",
+    "description": "Report image memory and swap large textures to downscaled proxies.",
+    "warning": "",
+    "doc_url": "",
+    "category": "Material",
+}
+
+PROXY_SOURCE_KEY = "proxy_source"
+PROXY_FAKE_USER_KEY = "proxy_source_fake_user"
+PROXY_FOLDER = "proxies"
+IMAGE_NODE_TYPES = {"TEX_IMAGE", "TEX_ENVIRONMENT"}
+
+
+# --------------------------------------------------------------------
+# Finding images
+# --------------------------------------------------------------------
+
+def image_nodes(tree, seen=None):
+    """Yield every image node of a node tree, descending into node groups."""
+    if seen is None:
+        seen = set()
+    if tree is None or tree.as_pointer() in seen:
+        return
+    seen.add(tree.as_pointer())
+    for node in tree.nodes:
+        if node.type in IMAGE_NODE_TYPES:
+            yield node
+        elif node.type == "GROUP":
+            yield from image_nodes(node.node_tree, seen)
+
+
+def collect_image_nodes(context, target):
+    """Map each used image to the nodes that use it."""
+    if target == "SELECTION":
+        objects = context.selected_objects
+        world = None
+    else:
+        objects = context.scene.objects
+        world = context.scene.world
+
+    trees = {}
+    for obj in objects:
+        for slot in obj.material_slots:
+            mat = slot.material
+            if mat and mat.use_nodes and mat.node_tree:
+                trees[mat.node_tree.as_pointer()] = mat.node_tree
+    if world and world.use_nodes and world.node_tree:
+        trees[world.node_tree.as_pointer()] = world.node_tree
+
+    users = {}
+    seen = set()
+    for tree in trees.values():
+        for node in image_nodes(tree, seen):
+            if node.image:
+                users.setdefault(node.image, []).append(node)
+    return users
+
+
+# --------------------------------------------------------------------
+# Memory report
+# --------------------------------------------------------------------
+
+def image_memory(image):
+    """Estimated (RAM, GPU) bytes of an image."""
+    width, height = image.size
+    pixels = width * height
+    ram = pixels * 4 * (4 if image.is_float else 1)
+    gpu = pixels * 4 * (2 if image.is_float else 1) * 4 // 3
+    return ram, gpu
+
+
+def format_bytes(size):
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+class ImageCost:
+    """One line of the memory report."""
+
+    def __init__(self, image, nodes):
+        self.name = image.name
+        self.size = tuple(image.size)
+        self.channels = image.channels
+        self.is_float = image.is_float
+        self.is_proxy = PROXY_SOURCE_KEY in image
+        self.users = len(nodes)
+        self.ram, self.gpu = image_memory(image)
+
+
+class TextureMemoryReport:
+    """Images of the last report, most expensive first."""
+
+    def __init__(self):
+        self.images = []
+
+    def run(self, context, target):
+        users = collect_image_nodes(context, target)
+        self.images = sorted(
+            (ImageCost(image, nodes) for image, nodes in users.items()),
+            key=lambda cost: cost.gpu,
+            reverse=True,
+        )
+
+    @property
+    def total_ram(self):
+        return sum(cost.ram for cost in self.images)
+
+    @property
+    def total_gpu(self):
+        return sum(cost.gpu for cost in self.images)
+
+    def report_lines(self):
+        lines = [
+            f"{len(self.images)} image(s): RAM {format_bytes(self.total_ram)}, "
+            f"GPU {format_bytes(self.total_gpu)}"
+        ]
+        for cost in self.images:
+            lines.append(
+                f"  {cost.name:<40} {cost.size[0]}x{cost.size[1]} "
+                f"{cost.channels}ch{' float' if cost.is_float else ''}  "
+                f"RAM {format_bytes(cost.ram)}  GPU {format_bytes(cost.gpu)}"
+                f"{'  (proxy)' if cost.is_proxy else ''}"
+            )
+        return lines
+
+
+texture_report = TextureMemoryReport()
+
+
+# --------------------------------------------------------------------
+# Proxies
+# --------------------------------------------------------------------
+
+def proxy_path(image, factor):
+    """Where the proxy of `image` at 1/`factor` size is written."""
+    source = bpy.path.abspath(image.filepath)
+    if bpy.data.filepath:
+        folder = os.path.join(os.path.dirname(bpy.data.filepath), PROXY_FOLDER)
+    else:
+        folder = os.path.join(os.path.dirname(source), PROXY_FOLDER)
+    stem, ext = os.path.splitext(os.path.basename(source))
+    # Files with the same name in different folders get different proxies.
+    key = hashlib.sha1(os.path.normcase(os.path.abspath(source)).encode()).hexdigest()[:8]
+    return os.path.join(folder, f"{stem}_{key}_1-{factor}{ext}")
+
+
+def build_proxy_command(source, target, width, height):
+    """Headless Blender call that writes one downscaled copy of `source`."""
+    return [
+        bpy.app.binary_path,
+        "-b",
+        "--factory-startup",
+        "--python",
+        os.path.abspath(__file__),
+        "--",
+        "proxy",
+        source,
+        target,
+        str(width),
+        str(height),
+    ]
+
+
+def _run_proxy_job(job):
+    """Run one proxy worker; returns the job and an error message or ""."""
+    source, target, width, height = job
+    if os.path.exists(target) and os.path.getmtime(target) >= os.path.getmtime(source):
+        return job, ""
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    try:
+        proc = subprocess.run(
+            build_proxy_command(source, target, width, height),
+            capture_output=True,
+            text=True,
+            errors="replace",
+        )
+    except OSError as e:
+        return job, str(e)
+    if proc.returncode != 0 or not os.path.exists(target):
+        return job, (proc.stderr or proc.stdout).strip()[-500:] or "worker failed"
+    return job, ""
+
+
+def make_proxies(images, factor, workers, on_done=None):
+    """Write proxies of `images` in parallel; returns {image: proxy path or None}."""
+    # One job per proxy file; several images can use the same source file.
+    jobs = {}
+    for image in images:
+        source = bpy.path.abspath(image.filepath)
+        width, height = image.size
+        if image.packed_file or image.source != "FILE" or not os.path.isfile(source):
+            continue
+        job = (
+            source,
+            proxy_path(image, factor),
+            max(width // factor, 1),
+            max(height // factor, 1),
+        )
+        jobs.setdefault(job[1], (job, []))[1].append(image)
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+        queued = [job for job, _ in jobs.values()]
+        for done, (job, error) in enumerate(pool.map(_run_proxy_job, queued), 1):
+            for image in jobs[job[1]][1]:
+                if error:
+                    print(f"Proxy of {image.name} failed: {error}")
+                results[image] = None if error else job[1]
+            if on_done:
+                on_done(done, len(jobs))
+    return results
+
+
+def swap_to_proxy(image, path, nodes):
+    """Point `nodes` at the proxy image and let the original go.
+
+    Every original gets its own proxy image, so images sharing a source
+    file keep their own settings and each reverts to the right original.
+    """
+    proxy = next(
+        (
+            p
+            for p in bpy.data.images
+            if p.get(PROXY_SOURCE_KEY) == image.name
+            and bpy.path.abspath(p.filepath) == path
+        ),
+        None,
+    )
+    if proxy is None:
+        proxy = bpy.data.images.load(path, check_existing=False)
+    proxy[PROXY_SOURCE_KEY] = image.name
+    proxy[PROXY_FAKE_USER_KEY] = image.use_fake_user
+    proxy.colorspace_settings.name = image.colorspace_settings.name
+    proxy.alpha_mode = image.alpha_mode
+    for node in nodes:
+        node.image = proxy
+    image.use_fake_user = True
+    image.buffers_free()
+    return proxy
+
+
+def revert_proxies(context, target):
+    """Put the original images back on every node using a proxy."""
+    reverted = 0
+    for proxy, nodes in collect_image_nodes(context, target).items():
+        original = bpy.data.images.get(proxy.get(PROXY_SOURCE_KEY, ""))
+        if original is None:
+            continue
+        for node in nodes:
+            node.image = original
+        original.use_fake_user = bool(proxy.get(PROXY_FAKE_USER_KEY, False))
+        if proxy.users == 0:
+            bpy.data.images.remove(proxy)
+        reverted += 1
+    return reverted
+
+
+# --------------------------------------------------------------------
+# Operators
+# --------------------------------------------------------------------
+
+class TEXTURE_MEMORY_OT_report(Operator):
+    """List the used images sorted by estimated memory"""
+
+    bl_idname = "material.texture_memory_report"
+    bl_label = "Report"
+
+    def execute(self, context):
+        texture_report.run(context, context.scene.texture_memory_target)
+        for line in texture_report.report_lines():
+            print(line)
+        self.report({"INFO"}, texture_report.report_lines()[0])
+        return {"FINISHED"}
+
+
+class TEXTURE_MEMORY_OT_use_proxies(Operator):
+    """Downscale the used images and swap the image nodes to the proxies"""
+
+    bl_idname = "material.texture_memory_use_proxies"
+    bl_label = "Use Proxies"
+    bl_options = {"REGISTER", "UNDO"}
+
+    def execute(self, context):
+        scene = context.scene
+        factor = int(scene.texture_memory_factor)
+        users = collect_image_nodes(context, scene.texture_memory_target)
+        images = [
+            image
+            for image in users
+            if PROXY_SOURCE_KEY not in image
+            and max(image.size) >= scene.texture_memory_min_size
+        ]
+        if not images:
+            self.report({"INFO"}, "No images to downscale.")
+            return {"FINISHED"}
+
+        wm = context.window_manager
+        wm.progress_begin(0, len(images))
+        try:
+            results = make_proxies(
+                images,
+                factor,
+                scene.texture_memory_workers,
+                on_done=lambda done, total: wm.progress_update(done),
+            )
+        finally:
+            wm.progress_end()
+
+        swapped = 0
+        for image, path in results.items():
+            if path:
+                swap_to_proxy(image, path, users[image])
+                swapped += 1
+
+        texture_report.run(context, scene.texture_memory_target)
+        failed = len(images) - swapped
+        if failed:
+            self.report(
+                {"WARNING"},
+                f"Swapped {swapped} image(s) to proxies; {failed} skipped or failed "
+                "(see console)",
+            )
+        else:
+            self.report({"INFO"}, f"Swapped {swapped} image(s) to 1/{factor} proxies")
+        return {"FINISHED"}
+
+
+class TEXTURE_MEMORY_OT_revert(Operator):
+    """Put the original images back in place of the proxies"""
+
+    bl_idname = "material.texture_memory_revert"
+    bl_label = "Revert"
+    bl_options = {"REGISTER", "UNDO"}
+
+    def execute(self, context):
+        reverted = revert_proxies(context, context.scene.texture_memory_target)
+        texture_report.run(context, context.scene.texture_memory_target)
+        self.report({"INFO"}, f"Reverted {reverted} proxy image(s)")
+        return {"FINISHED"}
+
+
+# --------------------------------------------------------------------
+# Panel in 3D Viewport Sidebar
+# --------------------------------------------------------------------
+
+class VIEW3D_PT_texture_memory_panel(Panel):
+    bl_label = "Texture Memory"
+    bl_idname = "VIEW3D_PT_texture_memory_panel"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "Tool"
+
+    MAX_ROWS = 15
+
+    def draw(self, context):
+        layout = self.layout
+        scene = context.scene
+        layout.row().prop(scene, "texture_memory_target", expand=True)
+        layout.operator(TEXTURE_MEMORY_OT_report.bl_idname, icon="IMAGE_DATA")
+
+        if texture_report.images:
+            box = layout.box()
+            box.label(
+                text=f"RAM {format_bytes(texture_report.total_ram)}  "
+                f"GPU {format_bytes(texture_report.total_gpu)}"
+            )
+            for cost in texture_report.images[: self.MAX_ROWS]:
+                row = box.row()
+                row.label(
+                    text=cost.name, icon="FILE_IMAGE" if cost.is_proxy else "IMAGE_DATA"
+                )
+                row.label(text=f"{cost.size[0]}x{cost.size[1]}  {format_bytes(cost.gpu)}")
+            hidden = len(texture_report.images) - self.MAX_ROWS
+            if hidden > 0:
+                box.label(text=f"... {hidden} more in the console")
+
+        col = layout.column()
+        col.prop(scene, "texture_memory_factor")
+        col.prop(scene, "texture_memory_min_size")
+        col.prop(scene, "texture_memory_workers")
+        row = layout.row(align=True)
+        row.operator(TEXTURE_MEMORY_OT_use_proxies.bl_idname, icon="IMAGE_REFERENCE")
+        row.operator(TEXTURE_MEMORY_OT_revert.bl_idname, icon="LOOP_BACK")
+
+
+# --------------------------------------------------------------------
+# Registration
+# --------------------------------------------------------------------
+
+classes = (
+    TEXTURE_MEMORY_OT_report,
+    TEXTURE_MEMORY_OT_use_proxies,
+    TEXTURE_MEMORY_OT_revert,
+    VIEW3D_PT_texture_memory_panel,
+)
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    bpy.types.Scene.texture_memory_target = bpy.props.EnumProperty(
+        name="Target",
+        description="Which materials to inspect",
+        items=[
+            ("SELECTION", "Selection", "Materials of the selected objects"),
+            ("SCENE", "Scene", "Materials of all objects in the scene and the world"),
+        ],
+        default="SCENE",
+    )
+    bpy.types.Scene.texture_memory_factor = bpy.props.EnumProperty(
+        name="Proxy Size",
+        description="Size of the proxies relative to the source images",
+        items=[
+            ("2", "1/2", "Half resolution"),
+            ("4", "1/4", "Quarter resolution"),
+            ("8", "1/8", "Eighth resolution"),
+        ],
+        default="2",
+    )
+    bpy.types.Scene.texture_memory_min_size = bpy.props.IntProperty(
+        name="Min Size",
+        description="Only downscale images at least this wide or tall",
+        default=2048,
+        min=1,
+    )
+    bpy.types.Scene.texture_memory_workers = bpy.props.IntProperty(
+        name="Workers",
+        description="Number of Blender processes writing proxies in parallel",
+        default=max(min(os.cpu_count() or 1, 8) // 2, 1),
+        min=1,
+        max=64,
+    )
+
+
+def unregister():
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
+    del bpy.types.Scene.texture_memory_target
+    del bpy.types.Scene.texture_memory_factor
+    del bpy.types.Scene.texture_memory_min_size
+    del bpy.types.Scene.texture_memory_workers
+
+
+# --------------------------------------------------------------------
+# Proxy worker (runs in a headless Blender)
+# --------------------------------------------------------------------
+
+def proxy_worker(argv):
+    """Load `source`, scale it to `width` x `height` and save it as `target`."""
+    source, target, width, height = argv[0], argv[1], int(argv[2]), int(argv[3])
+    image = bpy.data.images.load(source)
+    image.scale(width, height)
+    image.filepath_raw = target
+    image.save()
+    return 0
+
+
+if __name__ == "__main__":
+    args = sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else []
+    if args[:1] == ["proxy"]:
+        sys.exit(proxy_worker(args[1:]))
+    register()
@@ -9,27 +9,6 @@ bl_info = {
 }
 
 import bpy
-import subprocess
-import platform
-
-
-def copy_to_clipboard(text):
-    """Copy text to clipboard."""
-    system = platform.system()
-    try:
-        if system == "Windows":
-            subprocess.run("clip", universal_newlines=True, input=text)
-        elif system == "Darwin":  # macOS
-            subprocess.run("pbcopy", universal_newlines=True, input=text)
-        else:  # Assume Linux
-            subprocess.run(
-                "xclip -selection clipboard",
-                shell=True,
-                universal_newlines=True,
-                input=text,
-            )
-    except Exception as e:
-        print("Error copying to clipboard:", e)
 
 
 class OUTLINER_OT_copy_selected_names(bpy.types.Operator):
@@ -44,7 +23,7 @@ class OUTLINER_OT_copy_selected_names(bpy.types.Operator):
         names = [obj.name for obj in selected_objects if hasattr(obj, "name")]
         if names:
             text = "\n".join(names)
-            copy_to_clipboard(text)
+            context.window_manager.clipboard = text
             self.report({"INFO"}, "Copied to clipboard")
         else:
             self.report({"WARNING"}, "No objects selected")
@@ -7,6 +7,12 @@ Description:
         - Remove specific modifiers or all modifiers from selected objects.
         - Hide (disable) specific modifiers or all modifiers in the viewport.
         - Show (enable) specific modifiers or all modifiers in the viewport.
+        - Enable, disable or toggle the viewport, render and edit mode flags
+          of modifiers on the selection, a collection or the whole scene.
+        - Profile the evaluation time and polygon cost of every modifier.
+        - Hide the heaviest modifiers until the viewport fits a polygon or
+          time budget, and restore them with one click.
+        - Save named snapshots of modifier visibility and switch between them.
 
     The modifier type list is dynamically generated based on modifiers currently present
     in the selected objects.
@@ -24,17 +30,37 @@ Usage:
 
 Features:
     - Works for all object types that support modifiers.
-    - Dynamic dropdown showing only modifiers present in selection.
+    - Dynamic dropdown showing only modifiers present in selection, with the
+      number of modifiers of each type.
+    - The dropdown is cached and only rebuilt when the selection or the
+      modifiers change, so the panel stays fast with thousands of objects.
     - Accurate reporting of affected modifiers.
     - Skips objects without the chosen modifier type.
     - Separate buttons for remove, hide, and show actions.
+    - Bulk buttons read and write each modifier stack in one call with
+      `foreach_get`/`foreach_set`, so tens of thousands of modifiers switch
+      in milliseconds.
+    - The Profile sub-panel switches each modifier on in stack order and
+      times the depsgraph evaluation, listing the slowest types and
+      instances. The full report is printed to the system console.
+    - The Governor remembers exactly which modifiers it hid (stored on the
+      scene, so it survives saving) and only ever restores those.
+    - Snapshots are stored on the scene as packed int arrays (one int of
+      flag bits per modifier). Restoring only writes flags that differ.
 
 Notes:
-    - Hiding/showing affects only viewport visibility (not render visibility).
+    - Hide/Show affect only viewport visibility; use the Bulk box for render
+      and edit mode flags.
+    - The Governor only changes viewport visibility (`show_viewport`). Final
+      renders use the Render flags, so they always include every modifier.
     - Removing modifiers is irreversible unless undone (Ctrl+Z).
 """
 
+import json
+import time
+
 import bpy
+from bpy.app.handlers import persistent
 from bpy.types import Operator, Panel
 
 
@@ -55,18 +81,79 @@ bl_info = {
 # Utility: Get dropdown items dynamically from selected objects
 # --------------------------------------------------------------------
 
+class ModifierTypeCache:
+    """Per-type modifier counts of the selection, rebuilt only when needed.
+
+    Enum item callbacks run on every redraw of the panel, so walking every
+    modifier of every selected object each time gets slow with thousands of
+    objects. The counts are rebuilt only after a depsgraph update that may
+    have changed modifiers or the selection, or when a cheap fingerprint of
+    the selection (object count and active object) differs.
+    """
+
+    def __init__(self):
+        self.dirty = True
+        self.fingerprint = None
+        self.counts = {}
+        self.items = [("ALL", "All", "Affect every modifier")]
+
+    @staticmethod
+    def _fingerprint(context):
+        view_layer = context.view_layer
+        if view_layer is None:
+            return None
+        active = view_layer.objects.active
+        return (
+            context.scene.as_pointer(),
+            len(view_layer.objects.selected),
+            active.as_pointer() if active else 0,
+        )
+
+    def get_items(self, context):
+        fingerprint = self._fingerprint(context)
+        if self.dirty or fingerprint is None or fingerprint != self.fingerprint:
+            self.rebuild(context)
+            self.fingerprint = fingerprint
+            self.dirty = False
+        return self.items
+
+    def rebuild(self, context):
+        counts = {}
+        for obj in context.selected_objects:
+            for m in obj.modifiers:
+                counts[m.type] = counts.get(m.type, 0) + 1
+        self.counts = counts
+
+        total = sum(counts.values())
+        items = [("ALL", f"All ({total})" if total else "All", "Affect every modifier")]
+        for mod_type in sorted(counts, key=lambda t: t.title()):
+            title = mod_type.title()
+            items.append(
+                (mod_type, f"{title} ({counts[mod_type]})", f"Affect {title} modifiers")
+            )
+        # Blender needs the item strings to stay referenced, which the cache does.
+        self.items = items
+
+
+modifier_type_cache = ModifierTypeCache()
+
+
 def get_modifier_items(self, context):
     """Generate dropdown items based on selected objects."""
-    if not context.selected_objects:
-        return [("ALL", "All", "Affect every modifier")]
-    types = {
-        (m.type, m.type.title(), f"Affect {m.type.title()} modifiers")
-        for obj in context.selected_objects
-        for m in obj.modifiers
-    }
-    if not types:
-        return [("ALL", "All", "Affect every modifier")]
-    return [("ALL", "All", "Affect every modifier")] + sorted(types, key=lambda x: x[1])
+    return modifier_type_cache.get_items(context)
+
+
+@persistent
+def invalidate_modifier_cache(scene, depsgraph):
+    """Mark the cache dirty when objects changed or the selection did."""
+    if modifier_type_cache.dirty:
+        return
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Scene) or (
+            isinstance(update.id, bpy.types.Object) and update.is_updated_geometry
+        ):
+            modifier_type_cache.dirty = True
+            return
 
 
 # --------------------------------------------------------------------
@@ -159,6 +246,661 @@ class ShowModifierOperator(Operator):
         return {"FINISHED"}
 
 
+# --------------------------------------------------------------------
+# Operator: Bulk modifier changes on selection, collection or scene
+# --------------------------------------------------------------------
+
+MODIFIER_FLAGS = {
+    "VIEWPORT": "show_viewport",
+    "RENDER": "show_render",
+    "EDITMODE": "show_in_editmode",
+}
+
+TARGET_ITEMS = [
+    ("SELECTION", "Selection", "Selected objects"),
+    ("COLLECTION", "Collection", "All objects in a collection and its children"),
+    ("SCENE", "Scene", "All objects in the scene"),
+]
+
+FLAG_ITEMS = [
+    ("VIEWPORT", "Viewport", "Display in the viewport"),
+    ("RENDER", "Render", "Use in renders"),
+    ("EDITMODE", "Edit Mode", "Display in Edit Mode"),
+]
+
+
+def get_target_objects(context, target, collection=None):
+    """Objects affected by a bulk operation."""
+    if target == "SELECTION":
+        return context.selected_objects
+    if target == "COLLECTION":
+        return collection.all_objects if collection else []
+    return context.scene.objects
+
+
+def set_modifier_flag(objects, prop, action, mod_type="ALL"):
+    """Enable, disable or toggle one visibility flag of matching modifiers.
+
+    Reads and writes the flag of a whole modifier stack at once with
+    `foreach_get`/`foreach_set` and only writes (and tags for re-evaluation)
+    stacks where something actually changes. `foreach_set` skips the RNA
+    update, so changed objects are tagged explicitly.
+
+    Returns the number of modifiers changed and of objects touched.
+    """
+    changed_mods = 0
+    changed_objs = 0
+    for obj in objects:
+        mods = obj.modifiers
+        count = len(mods)
+        if not count:
+            continue
+
+        current = [False] * count
+        mods.foreach_get(prop, current)
+        if action == "TOGGLE":
+            wanted = [not value for value in current]
+        else:
+            wanted = [action == "ENABLE"] * count
+        if mod_type != "ALL":
+            wanted = [
+                new if m.type == mod_type else old
+                for new, old, m in zip(wanted, current, mods)
+            ]
+
+        diff = sum(new != old for new, old in zip(wanted, current))
+        if diff:
+            mods.foreach_set(prop, wanted)
+            obj.update_tag()
+            changed_mods += diff
+            changed_objs += 1
+    return changed_mods, changed_objs
+
+
+def remove_modifiers(objects, mod_type="ALL"):
+    """Remove matching modifiers; whole stacks are cleared in one call."""
+    removed = 0
+    for obj in objects:
+        mods = obj.modifiers
+        if not len(mods):
+            continue
+        if mod_type == "ALL":
+            removed += len(mods)
+            mods.clear()
+            continue
+        for m in [m for m in mods if m.type == mod_type]:
+            mods.remove(m)
+            removed += 1
+    return removed
+
+
+class BulkModifierOperator(Operator):
+    """Change modifiers of the selection, a collection or the whole scene"""
+
+    bl_idname = "object.bulk_modifier"
+    bl_label = "Bulk Modifier Change"
+    bl_options = {"REGISTER", "UNDO"}
+
+    action: bpy.props.EnumProperty(
+        name="Action",
+        items=[
+            ("ENABLE", "Enable", "Turn the chosen flags on"),
+            ("DISABLE", "Disable", "Turn the chosen flags off"),
+            ("TOGGLE", "Toggle", "Invert the chosen flags of every modifier"),
+            ("REMOVE", "Remove", "Delete the modifiers"),
+        ],
+        default="DISABLE",
+    )
+
+    target: bpy.props.EnumProperty(name="Target", items=TARGET_ITEMS, default="SELECTION")
+
+    collection: bpy.props.StringProperty(
+        name="Collection", description="Collection used when the target is Collection"
+    )
+
+    flags: bpy.props.EnumProperty(
+        name="Flags",
+        items=FLAG_ITEMS,
+        options={"ENUM_FLAG"},
+        default={"VIEWPORT"},
+    )
+
+    mod_type: bpy.props.EnumProperty(
+        name="Modifier Type",
+        description="Choose which modifier type to change",
+        items=get_modifier_items,
+    )
+
+    def execute(self, context):
+        collection = bpy.data.collections.get(self.collection)
+        if self.target == "COLLECTION" and collection is None:
+            self.report({"ERROR"}, "Choose a collection.")
+            return {"CANCELLED"}
+
+        start = time.perf_counter()
+        objects = get_target_objects(context, self.target, collection)
+
+        if self.action == "REMOVE":
+            removed = remove_modifiers(objects, self.mod_type)
+            elapsed = (time.perf_counter() - start) * 1000
+            self.report({"INFO"}, f"Removed {removed} modifier(s) in {elapsed:.1f} ms")
+            return {"FINISHED"}
+
+        if not self.flags:
+            self.report({"ERROR"}, "Choose at least one flag.")
+            return {"CANCELLED"}
+
+        changed_mods = 0
+        changed_objs = 0
+        for flag in self.flags:
+            mods, objs = set_modifier_flag(
+                objects, MODIFIER_FLAGS[flag], self.action, self.mod_type
+            )
+            changed_mods += mods
+            changed_objs = max(changed_objs, objs)
+        elapsed = (time.perf_counter() - start) * 1000
+        self.report(
+            {"INFO"},
+            f"Changed {changed_mods} modifier flag(s) on {changed_objs} object(s) "
+            f"in {elapsed:.1f} ms",
+        )
+        return {"FINISHED"}
+
+
+# --------------------------------------------------------------------
+# Profiler: evaluation time and polygon cost of every modifier
+# --------------------------------------------------------------------
+
+class ModifierCost:
+    """Measured cost of one modifier instance."""
+
+    def __init__(self, obj, modifier, mod_type, index, time_ms, polygons, total_polygons):
+        self.object = obj
+        self.modifier = modifier
+        self.type = mod_type
+        self.index = index
+        self.time_ms = time_ms
+        self.polygons = polygons
+        self.total_polygons = total_polygons
+
+
+def evaluated_polygon_count(obj, depsgraph):
+    """Polygon count of the evaluated object, 0 for non-geometry objects."""
+    obj_eval = obj.evaluated_get(depsgraph)
+    if obj.type == "MESH":
+        return len(obj_eval.data.polygons)
+    try:
+        mesh = obj_eval.to_mesh()
+    except RuntimeError:
+        return 0
+    count = len(mesh.polygons) if mesh else 0
+    obj_eval.to_mesh_clear()
+    return count
+
+
+def _measure_evaluation(obj, depsgraph, repeats):
+    """Best evaluation time in ms of `obj` and its evaluated polygon count."""
+    best = None
+    for _ in range(max(repeats, 1)):
+        obj.update_tag(refresh={"DATA"})
+        start = time.perf_counter()
+        depsgraph.update()
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best, evaluated_polygon_count(obj, depsgraph)
+
+
+def profile_object_modifiers(obj, depsgraph, repeats=3):
+    """Measure each viewport-enabled modifier of `obj` in stack order.
+
+    All modifiers are turned off, then switched back on one at a time. The
+    growth in evaluation time and polygon count after each step is the cost
+    of that modifier, including what it adds to the modifiers after it in
+    the stack. The original visibility is always restored.
+    """
+    mods = obj.modifiers
+    count = len(mods)
+    original = [False] * count
+    if count:
+        mods.foreach_get("show_viewport", original)
+    enabled = [i for i, on in enumerate(original) if on]
+    if not enabled:
+        return []
+
+    state = [False] * count
+    results = []
+    try:
+        mods.foreach_set("show_viewport", state)
+        prev_time, prev_polys = _measure_evaluation(obj, depsgraph, repeats)
+        for i in enabled:
+            state[i] = True
+            mods.foreach_set("show_viewport", state)
+            elapsed, polys = _measure_evaluation(obj, depsgraph, repeats)
+            cost = ModifierCost(
+                obj.name,
+                mods[i].name,
+                mods[i].type,
+                i,
+                max(elapsed - prev_time, 0.0),
+                polys - prev_polys,
+                polys,
+            )
+            results.append(cost)
+            prev_time, prev_polys = elapsed, polys
+    finally:
+        mods.foreach_set("show_viewport", original)
+        obj.update_tag(refresh={"DATA"})
+    return results
+
+
+class ModifierProfile:
+    """Results of the last profiling run, sorted most expensive first."""
+
+    def __init__(self):
+        self.instances = []
+        self.types = []
+        self.total_ms = 0.0
+
+    def clear(self):
+        self.instances = []
+        self.types = []
+        self.total_ms = 0.0
+
+    def run(self, objects, depsgraph, repeats=3):
+        instances = []
+        for obj in objects:
+            if obj.modifiers:
+                instances.extend(profile_object_modifiers(obj, depsgraph, repeats))
+        depsgraph.update()
+
+        types = {}
+        for cost in instances:
+            entry = types.setdefault(cost.type, [cost.type, 0, 0.0, 0])
+            entry[1] += 1
+            entry[2] += cost.time_ms
+            entry[3] += cost.polygons
+
+        self.instances = sorted(instances, key=lambda c: c.time_ms, reverse=True)
+        self.types = sorted(types.values(), key=lambda t: t[2], reverse=True)
+        self.total_ms = sum(c.time_ms for c in instances)
+
+    def report_lines(self, limit=None):
+        lines = [f"Modifier cost: {self.total_ms:.1f} ms total"]
+        lines.append("By type:")
+        for mod_type, count, time_ms, polys in self.types[:limit]:
+            lines.append(
+                f"  {mod_type.title():<20} x{count:<5} {time_ms:9.2f} ms  {polys:+d} polys"
+            )
+        lines.append("By instance:")
+        for c in self.instances[:limit]:
+            lines.append(
+                f"  {c.object} / {c.modifier} ({c.type.title()}): "
+                f"{c.time_ms:.2f} ms  {c.polygons:+d} polys"
+            )
+        return lines
+
+
+modifier_profile = ModifierProfile()
+
+
+class ProfileModifiersOperator(Operator):
+    """Measure how much each modifier costs to evaluate"""
+
+    bl_idname = "object.profile_modifiers"
+    bl_label = "Profile Modifiers"
+
+    target: bpy.props.EnumProperty(name="Target", items=TARGET_ITEMS, default="SELECTION")
+
+    collection: bpy.props.StringProperty(
+        name="Collection", description="Collection used when the target is Collection"
+    )
+
+    repeats: bpy.props.IntProperty(
+        name="Repeats",
+        description="Evaluate each step this many times and keep the fastest",
+        default=3,
+        min=1,
+        max=20,
+    )
+
+    def execute(self, context):
+        collection = bpy.data.collections.get(self.collection)
+        objects = get_target_objects(context, self.target, collection)
+        if not objects:
+            self.report({"WARNING"}, "No objects to profile.")
+            return {"CANCELLED"}
+
+        modifier_profile.run(objects, context.evaluated_depsgraph_get(), self.repeats)
+        for line in modifier_profile.report_lines():
+            print(line)
+
+        if modifier_profile.instances:
+            top = modifier_profile.instances[0]
+            self.report(
+                {"INFO"},
+                f"Profiled {len(modifier_profile.instances)} modifier(s); slowest: "
+                f"{top.object} / {top.modifier} ({top.time_ms:.1f} ms)",
+            )
+        else:
+            self.report({"INFO"}, "No enabled modifiers found.")
+        return {"FINISHED"}
+
+
+class ClearModifierProfileOperator(Operator):
+    """Forget the last profiling results"""
+
+    bl_idname = "object.clear_modifier_profile"
+    bl_label = "Clear Profile"
+
+    def execute(self, context):
+        modifier_profile.clear()
+        return {"FINISHED"}
+
+
+# --------------------------------------------------------------------
+# Governor: hide the heaviest modifiers until the viewport fits a budget
+# --------------------------------------------------------------------
+
+GOVERNOR_KEY = "modifier_governor"
+
+HEAVY_TYPES = {
+    "SUBSURF",
+    "MULTIRES",
+    "BOOLEAN",
+    "REMESH",
+    "ARRAY",
+    "BEVEL",
+    "SOLIDIFY",
+    "SCREW",
+    "SKIN",
+    "OCEAN",
+    "NODES",
+}
+
+
+def get_governed(scene):
+    """(object name, modifier name) pairs the governor has hidden."""
+    return [tuple(pair) for pair in json.loads(scene.get(GOVERNOR_KEY, "[]"))]
+
+
+def set_governed(scene, pairs):
+    if pairs:
+        scene[GOVERNOR_KEY] = json.dumps(pairs)
+    elif GOVERNOR_KEY in scene:
+        del scene[GOVERNOR_KEY]
+
+
+def restore_governed(scene):
+    """Show again every modifier the governor hid; returns how many."""
+    restored = 0
+    for obj_name, mod_name in get_governed(scene):
+        obj = scene.objects.get(obj_name)
+        mod = obj.modifiers.get(mod_name) if obj else None
+        if mod is not None and not mod.show_viewport:
+            mod.show_viewport = True
+            restored += 1
+    set_governed(scene, [])
+    return restored
+
+
+def govern_modifiers(context, metric, budget, heavy_only=True, repeats=1):
+    """Hide the most expensive modifiers until the scene fits the budget.
+
+    Visible objects are profiled first, then modifiers are hidden from the
+    most to the least expensive until the total polygon count (or the
+    modifier evaluation time) is within `budget`. Costs are measured with
+    the rest of the stack enabled, so the result is an estimate. Every
+    hidden modifier is stored on the scene so `restore_governed` can undo
+    exactly those changes later.
+
+    Returns the hidden (object name, modifier name) pairs and the estimated
+    total after hiding them.
+    """
+    scene = context.scene
+    restore_governed(scene)
+
+    depsgraph = context.evaluated_depsgraph_get()
+    visible = list(context.visible_objects)
+    modifier_profile.run([o for o in visible if o.modifiers], depsgraph, repeats)
+
+    if metric == "POLYGONS":
+        total = sum(evaluated_polygon_count(o, depsgraph) for o in visible)
+        cost_of = lambda c: c.polygons  # noqa: E731
+    else:
+        total = modifier_profile.total_ms
+        cost_of = lambda c: c.time_ms  # noqa: E731
+
+    candidates = [
+        c
+        for c in modifier_profile.instances
+        if cost_of(c) > 0 and (not heavy_only or c.type in HEAVY_TYPES)
+    ]
+    candidates.sort(key=cost_of, reverse=True)
+
+    hidden = []
+    for cost in candidates:
+        if total <= budget:
+            break
+        mod = scene.objects[cost.object].modifiers[cost.modifier]
+        mod.show_viewport = False
+        hidden.append((cost.object, cost.modifier))
+        total -= cost_of(cost)
+
+    set_governed(scene, hidden)
+    return hidden, total
+
+
+class ApplyModifierGovernorOperator(Operator):
+    """Hide the most expensive modifiers until the viewport fits the budget"""
+
+    bl_idname = "object.modifier_governor_apply"
+    bl_label = "Fit Budget"
+    bl_options = {"REGISTER", "UNDO"}
+
+    def execute(self, context):
+        scene = context.scene
+        metric = scene.modifier_governor_metric
+        if metric == "POLYGONS":
+            budget = scene.modifier_governor_polygons
+        else:
+            budget = scene.modifier_governor_time
+        hidden, total = govern_modifiers(
+            context, metric, budget, scene.modifier_governor_heavy_only
+        )
+
+        unit = "polygons" if metric == "POLYGONS" else "ms"
+        level = {"INFO"} if total <= budget else {"WARNING"}
+        self.report(
+            level,
+            f"Hid {len(hidden)} modifier(s); estimated {total:,.0f} / {budget:,.0f} {unit}",
+        )
+        return {"FINISHED"}
+
+
+class RestoreModifierGovernorOperator(Operator):
+    """Show again every modifier hidden by the governor"""
+
+    bl_idname = "object.modifier_governor_restore"
+    bl_label = "Restore"
+    bl_options = {"REGISTER", "UNDO"}
+
+    def execute(self, context):
+        restored = restore_governed(context.scene)
+        self.report({"INFO"}, f"Restored {restored} modifier(s)")
+        return {"FINISHED"}
+
+
+# --------------------------------------------------------------------
+# Snapshots: named modifier states with instant restore
+# --------------------------------------------------------------------
+
+SNAPSHOT_KEY = "modifier_snapshots"
+
+# Flags stored per modifier, one bit each.
+SNAPSHOT_FLAGS = ("show_viewport", "show_render", "show_in_editmode", "show_on_cage")
+
+
+def read_modifier_states(mods):
+    """Packed flag bits of every modifier in a stack, one int per modifier."""
+    count = len(mods)
+    states = [0] * count
+    values = [False] * count
+    for bit, prop in enumerate(SNAPSHOT_FLAGS):
+        mods.foreach_get(prop, values)
+        for i, on in enumerate(values):
+            if on:
+                states[i] |= 1 << bit
+    return states
+
+
+def write_modifier_states(mods, states):
+    """Apply packed flag bits, writing only flags that differ.
+
+    Returns the number of modifiers whose state changed.
+    """
+    count = len(mods)
+    current = read_modifier_states(mods)
+    diff = [old ^ new for old, new in zip(current, states)]
+    if not any(diff):
+        return 0
+    values = [False] * count
+    for bit, prop in enumerate(SNAPSHOT_FLAGS):
+        mask = 1 << bit
+        if any(d & mask for d in diff):
+            for i, state in enumerate(states):
+                values[i] = bool(state & mask)
+            mods.foreach_set(prop, values)
+    return sum(1 for d in diff if d)
+
+
+def get_snapshots(scene):
+    """The scene's snapshot group, mapping snapshot name to its data."""
+    return scene.get(SNAPSHOT_KEY, {})
+
+
+def save_snapshot(scene, name, objects):
+    """Store the modifier states of `objects` under `name`.
+
+    A snapshot holds the object names (as JSON), the modifier count of each
+    object and the packed flags of all modifiers in one int array.
+    """
+    names = []
+    counts = []
+    states = []
+    for obj in objects:
+        mods = obj.modifiers
+        if not len(mods):
+            continue
+        names.append(obj.name)
+        counts.append(len(mods))
+        states.extend(read_modifier_states(mods))
+
+    if SNAPSHOT_KEY not in scene:
+        scene[SNAPSHOT_KEY] = {}
+    scene[SNAPSHOT_KEY][name] = {
+        "objects": json.dumps(names),
+        "counts": counts,
+        "states": states,
+    }
+    return len(states)
+
+
+def restore_snapshot(scene, name):
+    """Apply a snapshot, touching only modifiers whose state differs.
+
+    Objects that were deleted, or whose modifier count changed since the
+    snapshot was taken, are skipped. Returns the number of changed
+    modifiers and of skipped objects.
+    """
+    snapshot = get_snapshots(scene)[name]
+    names = json.loads(snapshot["objects"])
+    counts = list(snapshot["counts"])
+    states = list(snapshot["states"])
+
+    changed = 0
+    skipped = 0
+    offset = 0
+    for obj_name, count in zip(names, counts):
+        obj_states = states[offset : offset + count]
+        offset += count
+        obj = scene.objects.get(obj_name)
+        if obj is None or len(obj.modifiers) != count:
+            skipped += 1
+            continue
+        diff = write_modifier_states(obj.modifiers, obj_states)
+        if diff:
+            obj.update_tag()
+            changed += diff
+    return changed, skipped
+
+
+class SaveModifierSnapshotOperator(Operator):
+    """Store the modifier visibility of the Bulk target objects as a snapshot"""
+
+    bl_idname = "object.modifier_snapshot_save"
+    bl_label = "Save Snapshot"
+    bl_options = {"REGISTER", "UNDO"}
+
+    name: bpy.props.StringProperty(name="Name", default="Snapshot")
+
+    target: bpy.props.EnumProperty(name="Target", items=TARGET_ITEMS, default="SCENE")
+
+    collection: bpy.props.StringProperty(
+        name="Collection", description="Collection used when the target is Collection"
+    )
+
+    def execute(self, context):
+        if not self.name:
+            self.report({"ERROR"}, "Snapshot needs a name.")
+            return {"CANCELLED"}
+        collection = bpy.data.collections.get(self.collection)
+        objects = get_target_objects(context, self.target, collection)
+        count = save_snapshot(context.scene, self.name, objects)
+        self.report({"INFO"}, f"Saved {count} modifier state(s) as '{self.name}'")
+        return {"FINISHED"}
+
+
+class RestoreModifierSnapshotOperator(Operator):
+    """Apply a stored modifier snapshot"""
+
+    bl_idname = "object.modifier_snapshot_restore"
+    bl_label = "Restore Snapshot"
+    bl_options = {"REGISTER", "UNDO"}
+
+    name: bpy.props.StringProperty(name="Name")
+
+    def execute(self, context):
+        if self.name not in get_snapshots(context.scene):
+            self.report({"ERROR"}, f"No snapshot named '{self.name}'.")
+            return {"CANCELLED"}
+
+        start = time.perf_counter()
+        changed, skipped = restore_snapshot(context.scene, self.name)
+        elapsed = (time.perf_counter() - start) * 1000
+        message = f"Restored '{self.name}': {changed} modifier(s) changed in {elapsed:.1f} ms"
+        if skipped:
+            self.report({"WARNING"}, f"{message}, {skipped} changed object(s) skipped")
+        else:
+            self.report({"INFO"}, message)
+        return {"FINISHED"}
+
+
+class DeleteModifierSnapshotOperator(Operator):
+    """Delete a stored modifier snapshot"""
+
+    bl_idname = "object.modifier_snapshot_delete"
+    bl_label = "Delete Snapshot"
+    bl_options = {"REGISTER", "UNDO"}
+
+    name: bpy.props.StringProperty(name="Name")
+
+    def execute(self, context):
+        snapshots = get_snapshots(context.scene)
+        if self.name in snapshots:
+            del snapshots[self.name]
+        return {"FINISHED"}
+
+
 # --------------------------------------------------------------------
 # Panel in 3D Viewport Sidebar
 # --------------------------------------------------------------------
@@ -184,6 +926,133 @@ class VIEW3D_PT_modifier_tools_panel(Panel):
             context.scene.modifier_tool_type
         )
 
+        box = layout.box()
+        box.label(text="Bulk:")
+        box.prop(context.scene, "modifier_tool_target", expand=True)
+        if context.scene.modifier_tool_target == "COLLECTION":
+            box.prop(context.scene, "modifier_tool_collection", text="")
+        box.row().prop(context.scene, "modifier_tool_flags", expand=True)
+        row = box.row(align=True)
+        for action, icon in (
+            ("ENABLE", "CHECKBOX_HLT"),
+            ("DISABLE", "CHECKBOX_DEHLT"),
+            ("TOGGLE", "ARROW_LEFTRIGHT"),
+        ):
+            op = row.operator(
+                BulkModifierOperator.bl_idname, text=action.title(), icon=icon
+            )
+            op.action = action
+            op.target = context.scene.modifier_tool_target
+            op.flags = context.scene.modifier_tool_flags
+            op.mod_type = context.scene.modifier_tool_type
+            collection = context.scene.modifier_tool_collection
+            op.collection = collection.name if collection else ""
+
+
+class VIEW3D_PT_modifier_profile_panel(Panel):
+    bl_label = "Profile"
+    bl_idname = "VIEW3D_PT_modifier_profile_panel"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "Tool"
+    bl_parent_id = "VIEW3D_PT_modifier_tools_panel"
+    bl_options = {"DEFAULT_CLOSED"}
+
+    MAX_ROWS = 10
+
+    def draw(self, context):
+        layout = self.layout
+        collection = context.scene.modifier_tool_collection
+        row = layout.row(align=True)
+        op = row.operator(ProfileModifiersOperator.bl_idname, icon="TIME")
+        op.target = context.scene.modifier_tool_target
+        op.collection = collection.name if collection else ""
+        row.operator(ClearModifierProfileOperator.bl_idname, text="", icon="X")
+
+        if not modifier_profile.instances:
+            layout.label(text="Profiles the Bulk target objects.")
+            return
+
+        layout.label(text=f"Total: {modifier_profile.total_ms:.1f} ms")
+        box = layout.box()
+        box.label(text="Slowest types:")
+        for mod_type, count, time_ms, polys in modifier_profile.types[: self.MAX_ROWS]:
+            row = box.row()
+            row.label(text=f"{mod_type.title()} x{count}")
+            row.label(text=f"{time_ms:.1f} ms  {polys:+d}")
+
+        box = layout.box()
+        box.label(text="Slowest modifiers:")
+        for cost in modifier_profile.instances[: self.MAX_ROWS]:
+            row = box.row()
+            row.label(text=f"{cost.object} / {cost.modifier}")
+            row.label(text=f"{cost.time_ms:.1f} ms  {cost.polygons:+d}")
+
+
+class VIEW3D_PT_modifier_governor_panel(Panel):
+    bl_label = "Governor"
+    bl_idname = "VIEW3D_PT_modifier_governor_panel"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "Tool"
+    bl_parent_id = "VIEW3D_PT_modifier_tools_panel"
+    bl_options = {"DEFAULT_CLOSED"}
+
+    def draw(self, context):
+        layout = self.layout
+        scene = context.scene
+        layout.row().prop(scene, "modifier_governor_metric", expand=True)
+        if scene.modifier_governor_metric == "POLYGONS":
+            layout.prop(scene, "modifier_governor_polygons")
+        else:
+            layout.prop(scene, "modifier_governor_time")
+        layout.prop(scene, "modifier_governor_heavy_only")
+
+        governed = get_governed(scene)
+        row = layout.row(align=True)
+        row.operator(ApplyModifierGovernorOperator.bl_idname, icon="MOD_DECIM")
+        sub = row.row(align=True)
+        sub.enabled = bool(governed)
+        sub.operator(
+            RestoreModifierGovernorOperator.bl_idname,
+            text=f"Restore ({len(governed)})",
+            icon="LOOP_BACK",
+        )
+
+
+class VIEW3D_PT_modifier_snapshot_panel(Panel):
+    bl_label = "Snapshots"
+    bl_idname = "VIEW3D_PT_modifier_snapshot_panel"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "Tool"
+    bl_parent_id = "VIEW3D_PT_modifier_tools_panel"
+    bl_options = {"DEFAULT_CLOSED"}
+
+    def draw(self, context):
+        layout = self.layout
+        scene = context.scene
+        collection = scene.modifier_tool_collection
+
+        row = layout.row(align=True)
+        row.prop(scene, "modifier_snapshot_name", text="")
+        op = row.operator(SaveModifierSnapshotOperator.bl_idname, text="", icon="ADD")
+        op.name = scene.modifier_snapshot_name
+        op.target = scene.modifier_tool_target
+        op.collection = collection.name if collection else ""
+
+        for name, snapshot in get_snapshots(scene).items():
+            row = layout.row(align=True)
+            op = row.operator(
+                RestoreModifierSnapshotOperator.bl_idname,
+                text=f"{name} ({len(snapshot['states'])})",
+                icon="RECOVER_LAST",
+            )
+            op.name = name
+            row.operator(
+                DeleteModifierSnapshotOperator.bl_idname, text="", icon="X"
+            ).name = name
+
 
 # --------------------------------------------------------------------
 # Registration
@@ -193,7 +1062,18 @@ classes = (
     RemoveModifierOperator,
     HideModifierOperator,
     ShowModifierOperator,
+    BulkModifierOperator,
+    ProfileModifiersOperator,
+    ClearModifierProfileOperator,
+    ApplyModifierGovernorOperator,
+    RestoreModifierGovernorOperator,
+    SaveModifierSnapshotOperator,
+    RestoreModifierSnapshotOperator,
+    DeleteModifierSnapshotOperator,
     VIEW3D_PT_modifier_tools_panel,
+    VIEW3D_PT_modifier_profile_panel,
+    VIEW3D_PT_modifier_governor_panel,
+    VIEW3D_PT_modifier_snapshot_panel,
 )
 
 
@@ -206,12 +1086,72 @@ def register():
         items=get_modifier_items,
         default="ALL",
     )
+    bpy.types.Scene.modifier_tool_target = bpy.props.EnumProperty(
+        name="Target",
+        description="Objects the bulk buttons change",
+        items=TARGET_ITEMS,
+        default="SELECTION",
+    )
+    bpy.types.Scene.modifier_tool_collection = bpy.props.PointerProperty(
+        name="Collection",
+        description="Collection the bulk buttons change",
+        type=bpy.types.Collection,
+    )
+    bpy.types.Scene.modifier_tool_flags = bpy.props.EnumProperty(
+        name="Flags",
+        description="Modifier flags the bulk buttons change",
+        items=FLAG_ITEMS,
+        options={"ENUM_FLAG"},
+        default={"VIEWPORT"},
+    )
+    bpy.types.Scene.modifier_governor_metric = bpy.props.EnumProperty(
+        name="Budget",
+        description="What the governor keeps under the budget",
+        items=[
+            ("POLYGONS", "Polygons", "Evaluated polygons of all visible objects"),
+            ("TIME", "Time", "Evaluation time of all visible modifiers"),
+        ],
+        default="POLYGONS",
+    )
+    bpy.types.Scene.modifier_governor_polygons = bpy.props.IntProperty(
+        name="Max Polygons",
+        description="Polygon budget of the viewport",
+        default=5_000_000,
+        min=0,
+    )
+    bpy.types.Scene.modifier_governor_time = bpy.props.FloatProperty(
+        name="Max Time (ms)",
+        description="Modifier evaluation budget in milliseconds",
+        default=100.0,
+        min=0.0,
+    )
+    bpy.types.Scene.modifier_governor_heavy_only = bpy.props.BoolProperty(
+        name="Heavy Types Only",
+        description="Only hide generating modifiers such as Subdivision and Boolean",
+        default=True,
+    )
+    bpy.types.Scene.modifier_snapshot_name = bpy.props.StringProperty(
+        name="Snapshot Name",
+        description="Name of the next snapshot to save",
+        default="Layout",
+    )
+    bpy.app.handlers.depsgraph_update_post.append(invalidate_modifier_cache)
 
 
 def unregister():
+    if invalidate_modifier_cache in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(invalidate_modifier_cache)
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
     del bpy.types.Scene.modifier_tool_type
+    del bpy.types.Scene.modifier_tool_target
+    del bpy.types.Scene.modifier_tool_collection
+    del bpy.types.Scene.modifier_tool_flags
+    del bpy.types.Scene.modifier_governor_metric
+    del bpy.types.Scene.modifier_governor_polygons
+    del bpy.types.Scene.modifier_governor_time
+    del bpy.types.Scene.modifier_governor_heavy_only
+    del bpy.types.Scene.modifier_snapshot_name
 
 
 if __name__ == "__main__":
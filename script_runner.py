@@ -12,7 +12,28 @@ Features:
     - Each subfolder appears as a Category in the UI.
     - Selecting a category updates the Script dropdown with available `.py` files.
     - Run the selected script with one click.
-    - Optionally refresh the category/script lists with the refresh button.
+    - Compiled scripts are cached in memory (and optionally in `__pycache__`),
+      so repeat runs skip reading and compiling unchanged files.
+    - Optional non-blocking mode: scripts that define a generator function
+      `main` run in time slices with a progress bar and can be cancelled
+      with Esc. Any script can report progress with `progress(done, total)`.
+    - Search field finds scripts of every category by file name, docstring
+      title and top-level constants (fuzzy matching). Scripts are indexed with
+      `ast`, never executed, and the index is kept in `__pycache__`.
+    - Scripts can share helper modules: the scripts folder is importable and
+      only helpers that changed since the last run are reloaded.
+    - Scripts run as a single undo step by default and can walk large
+      selections in chunks with `chunked(...)` / `selected_chunks()`.
+    - Optional time budget: a watchdog aborts runaway scripts, reports the
+      line they were stuck on and rolls the scene back to before the run.
+    - Every run is timed and kept in a short history; runs can optionally be
+      profiled with cProfile, showing the hot functions and exporting `.pstats`.
+    - Batch mode runs a chain of scripts over a folder of `.blend` files in
+      parallel headless Blender processes, from the panel or the command line.
+    - Folder listings are cached and only rescanned when a folder changes.
+    - Optional folder watcher (inotify or polling) refreshes the lists by
+      itself when scripts are added, removed or renamed.
+    - Force a full rescan of the category/script lists with the refresh button.
 
 Usage:
     1. Place your `.py` scripts in subfolders inside your chosen scripts directory.
@@ -35,11 +56,67 @@ Tips:
     - To hide the script folder path from the UI, remove it from the panel draw function
       or move it to Add-on Preferences.
     - Works best when you keep reusable scripts organized by category.
+
+Shared helpers:
+    The scripts folder is added to `sys.path`, so scripts can import helper
+    modules from it, e.g. `from _shared.clipboard import copy_to_clipboard`.
+    Files and folders starting with an underscore are not shown as scripts or
+    categories. Before each run, helpers used by the script whose files
+    changed (and helpers importing them) are reloaded; everything else stays
+    imported.
+
+Batch mode from the command line:
+    blender -b --factory-startup --python script_runner.py -- batch \\
+        --root /path/to/scripts --blend-dir /path/to/files \\
+        --script materials/remove_material_duplicates.py --workers 4
+
+    Results are appended to a JSON-lines log; `--resume` skips files the log
+    already lists as `ok`. `--worker-command` replaces the Blender worker with
+    any program, e.g. a stub for testing the scheduler.
+
+Non-blocking scripts:
+    Put the work in a generator function called `main` and `yield` every
+    now and then. The runner executes `main` in short time slices from a
+    modal timer, so Blender stays responsive. With the option turned off the
+    same script simply runs to the end.
+
+        import bpy
+
+        def main():
+            objects = bpy.context.selected_objects
+            for i, obj in enumerate(objects):
+                obj.name = obj.name.upper()
+                progress(i + 1, len(objects))
+                yield
 """
 
+import ast
+import collections
+import cProfile
+import ctypes
+import ctypes.util
+import importlib.util
+import inspect
+import json
+import marshal
 import os
+import pstats
+import queue
+import select
+import shlex
+import struct
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+
 import bpy
-from bpy.types import Operator, Panel, PropertyGroup
+from bpy.app.handlers import persistent
+from bpy.types import Operator, Panel, PropertyGroup, UIList
+from bpy_extras.io_utils import ExportHelper
 
 bl_info = {
     "name": "Script Runner",
@@ -53,33 +130,1431 @@ bl_info = {
     "category": "Development",
 }
 
+# --- Script Index (cached directory listing) ---
+
+
+def _scan_categories(path):
+    with os.scandir(path) as entries:
+        names = sorted(
+            e.name
+            for e in entries
+            if e.is_dir()
+            and e.name not in SCRIPT_RUNNER_PN.IGNORED_FOLDERS
+            and not e.name.startswith(("_", "."))
+        )
+    return [(d, d, "") for d in names]
+
+
+def _scan_scripts(path):
+    with os.scandir(path) as entries:
+        names = sorted(
+            e.name
+            for e in entries
+            if e.name.endswith(".py") and not e.name.startswith("_")
+        )
+    return [(f, f, "") for f in names]
+
+
+class ScriptIndex:
+    """Cache of the categories and scripts found in the scripts folder.
+
+    Enum item callbacks run on every panel redraw, so listing folders each
+    time is slow on network shares. A folder is listed again only when its
+    modification time changes (adding, removing or renaming an entry always
+    updates it); otherwise a redraw costs a single `stat` call per folder.
+
+    The cached item lists are also kept alive between calls, which Blender
+    requires for strings returned from dynamic enum callbacks.
+    """
+
+    def __init__(self):
+        self._dirs = {}  # normalized path -> (mtime_ns, enum items)
+
+    def clear(self):
+        """Forget every cached listing so the next lookup rescans."""
+        self._dirs.clear()
+
+    def invalidate(self, path):
+        """Forget the cached listing of a single folder."""
+        self._dirs.pop(os.path.normpath(path), None)
+
+    def _listing(self, path, scan):
+        path = os.path.normpath(path)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            self._dirs.pop(path, None)
+            return []
+
+        cached = self._dirs.get(path)
+        if cached is None or cached[0] != mtime:
+            try:
+                cached = (mtime, scan(path))
+            except OSError:
+                return []
+            self._dirs[path] = cached
+        return cached[1]
+
+    def categories(self, root):
+        return self._listing(root, _scan_categories)
+
+    def scripts(self, root, category):
+        if not category:
+            return []
+        return self._listing(os.path.join(root, category), _scan_scripts)
+
+
+script_index = ScriptIndex()
+
+
+def get_scripts_root(props):
+    """Return the absolute path of the scripts folder (resolves `//`)."""
+    return bpy.path.abspath(props.folder_path)
+
+
+# --- Script Metadata and Search ---
+
+
+def _docstring_title(doc, filename):
+    """Pick a human readable title from a module docstring.
+
+    Skips the file name, underline rulers and section headings such as
+    `Description:` that most scripts in a collection start with.
+    """
+    for line in doc.splitlines():
+        line = line.strip().lstrip("*-• ").strip()
+        if not line or line == filename or set(line) <= set("-=~"):
+            continue
+        if line.endswith(":") and len(line.split()) <= 2:
+            continue
+        return line
+    return ""
+
+
+def parse_script_metadata(path):
+    """Read a script's docstring, title and top-level constants with `ast`.
+
+    The script is parsed, never executed. Constants are module level
+    assignments to UPPER_CASE names with literal values, e.g. `NODE_WIDTH`.
+    """
+    with open(path, "rb") as f:
+        tree = ast.parse(f.read(), path)
+
+    doc = ast.get_docstring(tree) or ""
+    constants = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1:
+            target, value = node.targets[0], node.value
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            target, value = node.target, node.value
+        else:
+            continue
+        if not (isinstance(target, ast.Name) and target.id.isupper()):
+            continue
+        try:
+            constants[target.id] = repr(ast.literal_eval(value))
+        except (ValueError, TypeError, SyntaxError, RecursionError, MemoryError):
+            # Not a literal, unhashable keys ({[1]: 2}) or too deeply nested.
+            continue
+
+    return {
+        "title": _docstring_title(doc, os.path.basename(path)),
+        "doc": doc,
+        "constants": constants,
+    }
+
+
+def fuzzy_score(query, text):
+    """Score how well `text` matches `query`; None if it does not match.
+
+    Every character of the query must appear in the text in order.
+    Consecutive characters, word starts and plain substrings score higher.
+    """
+    text = text.lower()
+    if query in text:
+        return 100 + len(query) * 10 - text.index(query)
+
+    score = 0
+    pos = 0
+    prev = -2
+    for ch in query:
+        idx = text.find(ch, pos)
+        if idx < 0:
+            return None
+        if idx == prev + 1:
+            score += 5
+        if idx == 0 or not text[idx - 1].isalnum():
+            score += 3
+        score -= min(idx - pos, 10)
+        prev = idx
+        pos = idx + 1
+    return score
+
+
+class ScriptMetadataIndex:
+    """Title, docstring and constants of every script, for searching.
+
+    Populated lazily on the first search and persisted as JSON in the
+    scripts root's `__pycache__` folder, so later sessions only parse the
+    scripts that changed. Each entry is invalidated by the file's mtime.
+    Files are re-checked at most every `REFRESH_INTERVAL` seconds, so typing
+    in the search field does not stat thousands of files per keystroke.
+    """
+
+    FILENAME = "script_runner_index.json"
+    REFRESH_INTERVAL = 5.0
+    MAX_RESULTS = 15
+
+    def __init__(self):
+        self.root = None
+        self._entries = {}  # "category/script.py" -> metadata dict
+        self._checked = 0.0
+        self._results_key = None
+        self._results = []
+
+    def _index_path(self):
+        return os.path.join(self.root, "__pycache__", self.FILENAME)
+
+    def _load(self, root):
+        self.root = root
+        self._entries = {}
+        self._checked = 0.0
+        self._results_key = None
+        try:
+            with open(self._index_path(), encoding="utf-8") as f:
+                self._entries = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    def _save(self):
+        path = self._index_path()
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def invalidate(self):
+        """Re-check every file on the next search."""
+        self._checked = 0.0
+
+    def refresh(self, root, force=False):
+        """Re-parse new and changed scripts, drop deleted ones."""
+        root = os.path.normpath(root)
+        if root != self.root:
+            self._load(root)
+        elif not force and time.monotonic() - self._checked < self.REFRESH_INTERVAL:
+            return
+
+        entries = {}
+        changed = False
+        for category, _, _ in script_index.categories(root):
+            for script, _, _ in script_index.scripts(root, category):
+                key = f"{category}/{script}"
+                path = os.path.join(root, category, script)
+                try:
+                    mtime = os.stat(path).st_mtime_ns
+                except OSError:
+                    continue
+                entry = self._entries.get(key)
+                if entry is None or entry.get("mtime") != mtime:
+                    # One unreadable script must not break the search for
+                    # all the others (this runs from the panel's draw).
+                    try:
+                        entry = parse_script_metadata(path)
+                    except (
+                        OSError,
+                        SyntaxError,
+                        ValueError,
+                        TypeError,
+                        RecursionError,
+                        MemoryError,
+                    ):
+                        entry = {"title": "", "doc": "", "constants": {}}
+                    entry["mtime"] = mtime
+                    changed = True
+                entries[key] = entry
+
+        changed = changed or entries.keys() != self._entries.keys()
+        self._entries = entries
+        self._checked = time.monotonic()
+        if changed:
+            self._results_key = None
+            self._save()
+
+    @staticmethod
+    def _match(token, name, entry):
+        best = None
+        for text, weight in (
+            (name, 3),
+            (entry["title"], 2),
+            (" ".join(entry["constants"]), 1),
+        ):
+            score = fuzzy_score(token, text)
+            if score is not None and (best is None or score * weight > best):
+                best = score * weight
+        if best is None and token in entry["doc"].lower():
+            best = 1
+        return best
+
+    def search(self, root, query):
+        """Return up to `MAX_RESULTS` `(key, title)` pairs, best match first."""
+        self.refresh(root)
+        tokens = query.lower().split()
+        key = (self.root, tuple(tokens))
+        if key == self._results_key:
+            return self._results
+
+        scored = []
+        for name, entry in self._entries.items():
+            total = 0
+            for token in tokens:
+                score = self._match(token, name, entry)
+                if score is None:
+                    break
+                total += score
+            else:
+                scored.append((-total, name, entry["title"]))
+
+        scored.sort()
+        self._results_key = key
+        self._results = [(name, title) for _, name, title in scored[: self.MAX_RESULTS]]
+        return self._results
+
+
+metadata_index = ScriptMetadataIndex()
+
+
+# --- Folder Watcher ---
+
+
+class _Inotify:
+    """Minimal ctypes binding of Linux inotify."""
+
+    IN_MODIFY = 0x002
+    IN_ATTRIB = 0x004
+    IN_MOVED_FROM = 0x040
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+    IN_DELETE = 0x200
+    IN_DELETE_SELF = 0x400
+    IN_MOVE_SELF = 0x800
+    IN_IGNORED = 0x8000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+
+    WATCH_MASK = (
+        IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO
+        | IN_DELETE_SELF | IN_MOVE_SELF
+    )
+    _EVENT = struct.Struct("iIII")  # wd, mask, cookie, len
+
+    def __init__(self):
+        libc_name = ctypes.util.find_library("c")
+        if not sys.platform.startswith("linux") or libc_name is None:
+            raise OSError("inotify is not available")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+    def add_watch(self, path):
+        wd = self._libc.inotify_add_watch(
+            self.fd, os.fsencode(path), self.WATCH_MASK
+        )
+        return wd if wd >= 0 else None
+
+    def read_events(self, timeout):
+        """Yield `(wd, mask, name)` tuples, waiting at most `timeout` seconds."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = self._EVENT.unpack_from(data, offset)
+            offset += self._EVENT.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+            yield wd, mask, os.fsdecode(name)
+
+    def close(self):
+        os.close(self.fd)
+
+
+class FolderWatcher:
+    """Background thread that reports changed folders of the scripts root.
+
+    Uses inotify where available and falls back to polling folder mtimes.
+    The thread never touches `bpy`; it only puts changed folder paths on a
+    queue that a `bpy.app.timers` callback drains on the main thread, so the
+    script index is invalidated per folder and the panel is redrawn only
+    when something actually changed.
+    """
+
+    def __init__(self, root, poll_interval=2.0, use_inotify=True):
+        self.root = os.path.normpath(root)
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify
+        self.changes = queue.Queue()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="ScriptRunnerWatcher", daemon=True
+        )
+
+    @property
+    def running(self):
+        return self._thread.is_alive()
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout=2.0)
+
+    def _subfolders(self):
+        try:
+            with os.scandir(self.root) as entries:
+                return [e.path for e in entries if e.is_dir()]
+        except OSError:
+            return []
+
+    def _run(self):
+        if self.use_inotify:
+            try:
+                inotify = _Inotify()
+            except (OSError, AttributeError):
+                inotify = None
+            if inotify is not None:
+                try:
+                    self._run_inotify(inotify)
+                finally:
+                    inotify.close()
+                return
+        self._run_polling()
+
+    def _run_inotify(self, inotify):
+        watches = {}
+        for path in [self.root] + self._subfolders():
+            wd = inotify.add_watch(path)
+            if wd is not None:
+                watches[wd] = path
+
+        while not self._stop.is_set():
+            changed = set()
+            for wd, mask, name in inotify.read_events(timeout=0.5):
+                path = watches.get(wd)
+                if path is None:
+                    continue
+                if mask & _Inotify.IN_IGNORED:
+                    del watches[wd]
+                    continue
+                changed.add(path)
+                if (
+                    path == self.root
+                    and mask & _Inotify.IN_ISDIR
+                    and mask & (_Inotify.IN_CREATE | _Inotify.IN_MOVED_TO)
+                ):
+                    sub = os.path.join(path, name)
+                    new_wd = inotify.add_watch(sub)
+                    if new_wd is not None:
+                        watches[new_wd] = sub
+                    changed.add(sub)
+            for path in changed:
+                self.changes.put(path)
+
+    def _run_polling(self):
+        def snapshot(paths):
+            mtimes = {}
+            for path in paths:
+                try:
+                    mtimes[path] = os.stat(path).st_mtime_ns
+                except OSError:
+                    pass
+            return mtimes
+
+        known = snapshot([self.root] + self._subfolders())
+        while not self._stop.wait(self.poll_interval):
+            paths = set(known)
+            if known.get(self.root) != snapshot([self.root]).get(self.root):
+                paths.update(self._subfolders())
+            current = snapshot(paths)
+            for path in paths:
+                if current.get(path) != known.get(path):
+                    self.changes.put(path)
+            known = current
+
+
+folder_watcher = None
+
+
+def _apply_watcher_changes():
+    """Timer callback: invalidate changed folders and redraw the panel."""
+    watcher = folder_watcher
+    if watcher is None or not watcher.running:
+        return None
+
+    changed = False
+    while True:
+        try:
+            path = watcher.changes.get_nowait()
+        except queue.Empty:
+            break
+        script_index.invalidate(path)
+        changed = True
+
+    if changed:
+        metadata_index.invalidate()
+        for window in bpy.context.window_manager.windows:
+            for area in window.screen.areas:
+                if area.type == "VIEW_3D":
+                    area.tag_redraw()
+    return 0.5
+
+
+def stop_folder_watcher():
+    global folder_watcher
+
+    if folder_watcher is not None:
+        folder_watcher.stop()
+        folder_watcher = None
+    if bpy.app.timers.is_registered(_apply_watcher_changes):
+        bpy.app.timers.unregister(_apply_watcher_changes)
+
+
+def sync_folder_watcher(props):
+    """Start, restart or stop the watcher to match the scene settings."""
+    global folder_watcher
+
+    stop_folder_watcher()
+    root = get_scripts_root(props)
+    if not (props.use_watcher and os.path.isdir(root)):
+        return
+
+    folder_watcher = FolderWatcher(
+        root,
+        poll_interval=props.watch_interval,
+        use_inotify=props.watch_mode == "AUTO",
+    )
+    folder_watcher.start()
+    bpy.app.timers.register(_apply_watcher_changes, first_interval=0.5)
+
+
+@persistent
+def _sync_folder_watcher_on_load(_dummy):
+    scene = bpy.context.scene
+    if scene is not None:
+        sync_folder_watcher(scene.script_runner_props)
+    else:
+        stop_folder_watcher()
+
+
+def _sync_folder_watcher_on_register():
+    """One-shot timer: start the watcher for a scene that already has it on.
+
+    `load_post` does not run when the add-on is enabled or reloaded, and
+    the scene is not reachable from `register()` itself.
+    """
+    _sync_folder_watcher_on_load(None)
+    return None
+
+
+# --- Compiled Code Cache ---
+
+
+class CodeCache:
+    """Compiled code objects of scripts, keyed on path, mtime and size.
+
+    Repeat runs of an unchanged script skip reading and compiling it. When
+    `use_disk` is set, code objects are also saved as marshal blobs in the
+    script's `__pycache__` folder (next to regular `.pyc` files), so later
+    Blender sessions can reuse them as well.
+    """
+
+    BLOB_SUFFIX = f".{sys.implementation.cache_tag}.runner"
+    _HEADER = struct.Struct("<4sqq")  # magic number, mtime_ns, size
+
+    def __init__(self):
+        self._codes = {}  # path -> ((mtime_ns, size), code)
+
+    def clear(self):
+        self._codes.clear()
+
+    def get(self, path, use_disk=False):
+        """Return the code object for `path`, compiling it only if needed."""
+        stat = os.stat(path)
+        key = (stat.st_mtime_ns, stat.st_size)
+
+        cached = self._codes.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        code = self._load_blob(path, key) if use_disk else None
+        if code is None:
+            with open(path, "rb") as f:
+                code = compile(f.read(), path, "exec", dont_inherit=True)
+            if use_disk:
+                self._save_blob(path, key, code)
+
+        self._codes[path] = (key, code)
+        return code
+
+    def _blob_path(self, path):
+        folder, name = os.path.split(path)
+        stem = os.path.splitext(name)[0]
+        return os.path.join(folder, "__pycache__", stem + self.BLOB_SUFFIX)
+
+    def _load_blob(self, path, key):
+        try:
+            with open(self._blob_path(path), "rb") as f:
+                data = f.read()
+            magic, mtime, size = self._HEADER.unpack_from(data)
+            if magic != importlib.util.MAGIC_NUMBER or (mtime, size) != key:
+                return None
+            return marshal.loads(data[self._HEADER.size :])
+        except (OSError, ValueError, EOFError, TypeError, struct.error):
+            return None
+
+    def _save_blob(self, path, key, code):
+        blob_path = self._blob_path(path)
+        tmp_path = f"{blob_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(self._HEADER.pack(importlib.util.MAGIC_NUMBER, *key))
+                f.write(marshal.dumps(code))
+            os.replace(tmp_path, blob_path)
+        except OSError:
+            # A read-only share only loses the on-disk cache, not the run.
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+code_cache = CodeCache()
+
+
+# --- Shared Helper Modules ---
+
+
+def imported_module_names(tree, package=""):
+    """Return every module name an AST imports, including parent packages.
+
+    Relative imports are resolved against `package`. For `from a import b`
+    both `a` and `a.b` are returned, since `b` may be a submodule.
+    """
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                parts = package.split(".") if package else []
+                if node.level - 1 > len(parts):
+                    continue
+                parts = parts[: len(parts) - node.level + 1]
+                base = ".".join(parts + ([base] if base else []))
+            if base:
+                names.add(base)
+            names.update(
+                f"{base}.{alias.name}" if base else alias.name
+                for alias in node.names
+                if alias.name != "*"
+            )
+
+    with_parents = set()
+    for name in names:
+        parts = name.split(".")
+        with_parents.update(".".join(parts[:i]) for i in range(1, len(parts) + 1))
+    return with_parents
+
+
+class HelperModules:
+    """Hot reload of helper modules that scripts import from the scripts folder.
+
+    The scripts folder is put on `sys.path`, so scripts can share code, e.g.
+    `from _shared.clipboard import copy_to_clipboard`. Files and folders
+    starting with an underscore are not listed as categories or scripts.
+
+    Helper modules imported during a run stay in `sys.modules` between runs.
+    Before each run, only the helpers the script uses (directly or through
+    other helpers) are checked: modules whose file changed, and every helper
+    that imports one of them, are dropped from `sys.modules` so the run
+    imports them fresh. Unchanged helpers are reused as they are.
+    """
+
+    def __init__(self):
+        self.root = None
+        self._loaded = {}  # module name -> (file, mtime_ns, imported names)
+        self._script_imports = {}  # script path -> (mtime_ns, imported names)
+        self.script_helpers = {}  # script path -> helper modules it uses
+
+    def activate(self, root):
+        """Make `root` importable, forgetting helpers of a previous root."""
+        root = os.path.normpath(os.path.abspath(root))
+        if root != self.root:
+            self.purge()
+            if self.root in sys.path:
+                sys.path.remove(self.root)
+            self.root = root
+        if root not in sys.path:
+            sys.path.append(root)
+
+    def purge(self):
+        """Drop every tracked helper module from `sys.modules`."""
+        for name in self._loaded:
+            sys.modules.pop(name, None)
+        self._loaded.clear()
+        importlib.invalidate_caches()
+
+    def _imports_of(self, path, package=""):
+        with open(path, "rb") as f:
+            tree = ast.parse(f.read(), path)
+        return imported_module_names(tree, package)
+
+    def _script_import_names(self, script_path):
+        try:
+            mtime = os.stat(script_path).st_mtime_ns
+        except OSError:
+            return set()
+        cached = self._script_imports.get(script_path)
+        if cached is None or cached[0] != mtime:
+            try:
+                names = self._imports_of(script_path)
+            except (OSError, SyntaxError, ValueError):
+                names = set()
+            cached = (mtime, names)
+            self._script_imports[script_path] = cached
+        return cached[1]
+
+    def _closure(self, names):
+        """Tracked helpers reachable from `names` through their imports."""
+        found = set()
+        pending = [name for name in names if name in self._loaded]
+        while pending:
+            name = pending.pop()
+            if name in found:
+                continue
+            found.add(name)
+            pending.extend(
+                dep for dep in self._loaded[name][2] if dep in self._loaded
+            )
+        return found
+
+    def prepare(self, script_path):
+        """Unload changed helpers the script uses; return their names."""
+        for name in [n for n in self._loaded if n not in sys.modules]:
+            del self._loaded[name]
+
+        used = self._closure(self._script_import_names(script_path))
+        stale = set()
+        for name in used:
+            path, mtime, _ = self._loaded[name]
+            try:
+                if os.stat(path).st_mtime_ns != mtime:
+                    stale.add(name)
+            except OSError:
+                stale.add(name)
+        if not stale:
+            return []
+
+        # Helpers importing a stale helper (and submodules of a stale
+        # package) keep references to the old module, so they go as well.
+        changed = True
+        while changed:
+            changed = False
+            for name, (_, _, deps) in self._loaded.items():
+                if name in stale:
+                    continue
+                if deps & stale or any(name.startswith(s + ".") for s in stale):
+                    stale.add(name)
+                    changed = True
+
+        for name in stale:
+            module = sys.modules.pop(name, None)
+            path = self._loaded.pop(name)[0]
+            # `from package import name` prefers the parent's attribute.
+            parent_name, _, child = name.rpartition(".")
+            parent = sys.modules.get(parent_name)
+            if parent is not None and getattr(parent, child, None) is module:
+                delattr(parent, child)
+            # A `.pyc` only stores the source mtime in whole seconds, so a
+            # quick edit could otherwise be served from the stale bytecode.
+            try:
+                os.remove(importlib.util.cache_from_source(path))
+            except (OSError, ValueError, NotImplementedError):
+                pass
+        importlib.invalidate_caches()
+        return sorted(stale)
+
+    def record(self, script_path, modules_before):
+        """Track helper modules that were first imported by a run."""
+        prefix = self.root + os.sep
+        for name in set(sys.modules) - modules_before:
+            module = sys.modules.get(name)
+            path = getattr(module, "__file__", None)
+            if not path:
+                continue  # Namespace packages (plain folders) have no code.
+            path = os.path.normpath(path)
+            if not path.startswith(prefix):
+                continue
+            try:
+                mtime = os.stat(path).st_mtime_ns
+                deps = self._imports_of(path, module.__package__ or "")
+            except (OSError, SyntaxError, ValueError):
+                continue
+            self._loaded[name] = (path, mtime, deps)
+
+        self.script_helpers[script_path] = sorted(
+            self._closure(self._script_import_names(script_path))
+        )
+
+
+helper_modules = HelperModules()
+
+
+# --- Script Execution ---
+
+
+class ScriptCancelled(Exception):
+    """Reported when a run is cancelled before the script finished."""
+
+
+class ScriptTimeout(BaseException):
+    """Raised inside a script that ran out of its time budget.
+
+    Derived from BaseException (like KeyboardInterrupt), so a script's own
+    `except Exception` blocks do not swallow it.
+    """
+
+
+class Watchdog:
+    """Aborts the running script once its time budget is used up.
+
+    A helper thread injects `ScriptTimeout` into the main thread with
+    `PyThreadState_SetAsyncExc`. Python raises it at the next bytecode the
+    script executes, so unlike a trace hook the watchdog costs nothing while
+    the script runs; a long call into Blender is interrupted as soon as it
+    returns. The exception is raised again every `RETRY_INTERVAL` seconds in
+    case the script catches it anyway. It is only injected while armed,
+    i.e. while script code runs, never into Blender's own UI code.
+    """
+
+    RETRY_INTERVAL = 0.5
+
+    def __init__(self, budget, root):
+        self.budget = budget
+        self.root = os.path.normpath(root) if root else ""
+        self.deadline = time.monotonic() + budget
+        self.location = ""
+        self.fired = False
+        self._thread_id = threading.get_ident()
+        self._armed = False
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="ScriptRunnerWatchdog", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def expired(self):
+        return time.monotonic() >= self.deadline
+
+    def arm(self):
+        with self._lock:
+            self._armed = True
+
+    def disarm(self):
+        with self._lock:
+            self._armed = False
+            # Drop an exception that was injected but not raised yet.
+            ctypes.pythonapi.PyThreadState_SetAsyncExc(
+                ctypes.c_ulong(self._thread_id), None
+            )
+
+    def stop(self):
+        self.disarm()
+        self._stop.set()
+
+    def _run(self):
+        wait = max(self.deadline - time.monotonic(), 0.0)
+        while not self._stop.wait(wait):
+            wait = self.RETRY_INTERVAL
+            with self._lock:
+                if not self._armed:
+                    continue
+                if not self.location:
+                    self.location = self._where()
+                self.fired = True
+                ctypes.pythonapi.PyThreadState_SetAsyncExc(
+                    ctypes.c_ulong(self._thread_id), ctypes.py_object(ScriptTimeout)
+                )
+
+    def _where(self):
+        """Innermost line of script code the main thread is executing."""
+        frame = sys._current_frames().get(self._thread_id)
+        innermost = None
+        while frame is not None:
+            filename = os.path.normpath(frame.f_code.co_filename)
+            text = f"{filename}:{frame.f_lineno} in {frame.f_code.co_name}"
+            if innermost is None:
+                innermost = text
+            if self.root and filename.startswith(self.root + os.sep):
+                return os.path.relpath(filename, self.root) + text[len(filename) :]
+            frame = frame.f_back
+        return innermost or "unknown location"
+
+
+def _rollback_aborted_run(label):
+    """Undo what an aborted run changed, back to the step pushed before it.
+
+    Runs from a timer once the operator has returned: the aborted state is
+    pushed as its own step (so it can still be inspected with Redo) and
+    then undone.
+    """
+
+    def rollback():
+        wm = bpy.context.window_manager
+        if not wm.windows:
+            return None
+        if hasattr(bpy.context, "temp_override"):
+            with bpy.context.temp_override(window=wm.windows[0]):
+                bpy.ops.ed.undo_push(message=f"Aborted {label}")
+                bpy.ops.ed.undo()
+        else:
+            override = {"window": wm.windows[0]}
+            bpy.ops.ed.undo_push(override, message=f"Aborted {label}")
+            bpy.ops.ed.undo(override)
+        return None
+
+    bpy.app.timers.register(rollback, first_interval=0.01)
+
+
+class ScriptRun:
+    """Progress and cancel state of the script that is currently running."""
+
+    def __init__(self, label, profile=False, chunk_size=500):
+        self.label = label
+        self.chunk_size = chunk_size
+        self.watchdog = None
+        self.done = 0
+        self.total = 0
+        self.text = ""
+        self.cancel_requested = False
+        self.started = time.perf_counter()
+        self.profiler = cProfile.Profile() if profile else None
+
+    @contextmanager
+    def measure(self):
+        """Profile and watch the script code run inside the block.
+
+        Non-blocking runs enter this once per time slice, so the time Blender
+        spends between slices does not show up in the profile, and the
+        watchdog never interrupts Blender's own code.
+        """
+        profiler = self.profiler
+        if profiler is not None:
+            try:
+                profiler.enable()
+            except ValueError:
+                # Another profiler is already active; keep the timing only.
+                self.profiler = profiler = None
+        if self.watchdog is not None:
+            self.watchdog.arm()
+        try:
+            yield
+        finally:
+            if self.watchdog is not None:
+                self.watchdog.disarm()
+            if profiler is not None:
+                profiler.disable()
+
+    @property
+    def factor(self):
+        if self.total <= 0:
+            return 0.0
+        return min(max(self.done / self.total, 0.0), 1.0)
+
+    def status_text(self):
+        text = f"Running {self.label}"
+        if self.total:
+            text += f": {self.done}/{self.total}"
+        if self.text:
+            text += f" - {self.text}"
+        return text
+
+
+active_run = None
+
+
+# --- Run History ---
+
+
+class RunRecord:
+    """Outcome of one script run: wall-clock duration, status and profile."""
+
+    STATUS_ICONS = {
+        "FINISHED": "CHECKMARK",
+        "CANCELLED": "CANCEL",
+        "ERROR": "ERROR",
+        "TIMEOUT": "TIME",
+    }
+
+    def __init__(self, run_id, label, duration, status, message, profiler):
+        self.run_id = run_id
+        self.label = label
+        self.duration = duration
+        self.status = status
+        self.message = message
+        self.stats = pstats.Stats(profiler) if profiler is not None else None
+        self._hot = None
+
+    @property
+    def icon(self):
+        return self.STATUS_ICONS.get(self.status, "QUESTION")
+
+    def hot_functions(self, limit=10):
+        """Return `(function, calls, own time, cumulative time)` rows, slowest first."""
+        if self.stats is None:
+            return []
+        if self._hot is None:
+            rows = sorted(
+                self.stats.stats.items(), key=lambda item: item[1][2], reverse=True
+            )
+            self._hot = [
+                (pstats.func_std_string(func), nc, tt, ct)
+                for func, (_, nc, tt, ct, _) in rows[:limit]
+            ]
+        return self._hot
+
+
+class RunHistory:
+    """The last few script runs, newest first."""
+
+    def __init__(self, size=20):
+        self.runs = collections.deque(maxlen=size)
+        self.selected_id = None
+        self._next_id = 1
+
+    def add(self, run, status, message=""):
+        record = RunRecord(
+            self._next_id,
+            run.label,
+            time.perf_counter() - run.started,
+            status,
+            message,
+            run.profiler,
+        )
+        self._next_id += 1
+        self.runs.appendleft(record)
+        self.selected_id = record.run_id
+        return record
+
+    def resize(self, size):
+        self.runs = collections.deque(self.runs, maxlen=size)
+
+    def clear(self):
+        self.runs.clear()
+        self.selected_id = None
+
+    def selected(self):
+        for record in self.runs:
+            if record.run_id == self.selected_id:
+                return record
+        return None
+
+
+run_history = RunHistory()
+
+
+def progress(done, total=0, text=""):
+    """Report script progress, e.g. `progress(i + 1, len(objects))`.
+
+    Available to every script run by Script Runner. Shown as the cursor
+    progress counter, and in the panel for non-blocking runs.
+    """
+    run = active_run
+    if run is None:
+        return
+    run.done = done
+    run.total = total
+    run.text = text
+    wm = bpy.context.window_manager
+    if wm is not None:
+        wm.progress_update(run.factor * 100)
+
+
+def chunked(items, size=None):
+    """Yield lists of `size` items, reporting progress after each one.
+
+    Available to every script run by Script Runner. The default size is the
+    runner's Chunk Size option. In a non-blocking `main`, yield after each
+    chunk to give the UI a chance to update:
+
+        for chunk in chunked(bpy.context.selected_objects):
+            for obj in chunk:
+                ...
+            yield
+    """
+    items = list(items)
+    total = len(items)
+    if size is None:
+        size = active_run.chunk_size if active_run is not None else 500
+    size = max(1, size)
+    for start in range(0, total, size):
+        yield items[start : start + size]
+        progress(min(start + size, total), total)
+
+
+def selected_chunks(size=None):
+    """`chunked` over the selected objects."""
+    return chunked(bpy.context.selected_objects, size)
+
+
+def run_script_file(script_path, use_disk_cache, root=None):
+    """Execute a script file and return its globals.
+
+    With `root` given, helper modules in that folder can be imported and
+    changed ones are reloaded first (see `HelperModules`).
+    """
+    if root:
+        helper_modules.activate(root)
+        reloaded = helper_modules.prepare(script_path)
+        if reloaded:
+            print(f"Script Runner: reloading {', '.join(reloaded)}")
+    script_globals = {
+        "__name__": "__main__",
+        "__file__": script_path,
+        "progress": progress,
+        "chunked": chunked,
+        "selected_chunks": selected_chunks,
+    }
+    modules_before = set(sys.modules)
+    try:
+        exec(code_cache.get(script_path, use_disk=use_disk_cache), script_globals)
+    finally:
+        if root:
+            helper_modules.record(script_path, modules_before)
+    return script_globals
+
+
+def get_script_main(script_globals):
+    """Return the script's `main` generator function, if it defines one.
+
+    Scripts that want to run without blocking the UI put their work in a
+    generator function called `main`; every `yield` inside it is a point
+    where the runner may hand control back to Blender.
+    """
+    main = script_globals.get("main")
+    if inspect.isgeneratorfunction(main):
+        return main
+    return None
+
+
+# --- Batch Processing ---
+
+# Tokens are split like a shell command line first and then formatted, so
+# paths with spaces stay single arguments. A token that is exactly
+# `{scripts}` expands to one argument per script.
+DEFAULT_WORKER_COMMAND = (
+    "{blender} --background --factory-startup {blend} --python-exit-code 1 "
+    "--python {runner} -- worker --root {root} {save} {scripts}"
+)
+
+
+def find_blend_files(folder, recursive=False):
+    """Return the sorted `.blend` files of a folder (backups are skipped)."""
+    found = []
+    for dirpath, dirnames, filenames in os.walk(folder):
+        found.extend(
+            os.path.join(dirpath, name) for name in filenames if name.endswith(".blend")
+        )
+        if not recursive:
+            break
+        dirnames[:] = [d for d in dirnames if d not in SCRIPT_RUNNER_PN.IGNORED_FOLDERS]
+    return sorted(found)
+
+
+def build_worker_command(template, blend, scripts, root, save=True, blender=None):
+    """Turn a worker command template into an argument list for one file."""
+    values = {
+        "blender": blender or bpy.app.binary_path,
+        "blend": blend,
+        "runner": os.path.abspath(__file__),
+        "root": root,
+        "save": "--save" if save else "--no-save",
+    }
+    command = []
+    for token in shlex.split(template):
+        if token == "{scripts}":
+            command.extend(scripts)
+        else:
+            command.append(token.format(**values))
+    return command
+
+
+def read_batch_log(log_path):
+    """Return the last logged result of every file in a JSON-lines log."""
+    results = {}
+    try:
+        with open(log_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # A line cut short by an interrupted batch.
+                results[record.get("file")] = record
+    except OSError:
+        pass
+    return results
+
+
+def _run_worker(command, blend, timeout):
+    started = time.perf_counter()
+    record = {"file": blend, "status": "ok", "returncode": 0, "error": ""}
+    try:
+        proc = subprocess.run(
+            command, capture_output=True, text=True, errors="replace", timeout=timeout
+        )
+        record["returncode"] = proc.returncode
+        if proc.returncode != 0:
+            record["status"] = "failed"
+            record["error"] = (proc.stderr or proc.stdout).strip()[-2000:]
+    except subprocess.TimeoutExpired:
+        record["status"] = "timeout"
+        record["returncode"] = None
+        record["error"] = f"Timed out after {timeout} s"
+    except OSError as e:
+        record["status"] = "failed"
+        record["returncode"] = None
+        record["error"] = str(e)
+    record["duration"] = round(time.perf_counter() - started, 3)
+    record["finished"] = datetime.now().isoformat(timespec="seconds")
+    return record
+
+
+def run_batch(
+    blend_files,
+    scripts,
+    root,
+    log_path,
+    workers=2,
+    timeout=600,
+    save=True,
+    resume=False,
+    command_template=DEFAULT_WORKER_COMMAND,
+    blender=None,
+    stop_event=None,
+    on_result=None,
+):
+    """Run a chain of scripts over `.blend` files in parallel worker processes.
+
+    Every file is handled by its own worker process (headless Blender by
+    default, see `DEFAULT_WORKER_COMMAND`). One JSON line per file is
+    appended to `log_path`; with `resume` set, files already logged as
+    `ok` are skipped. Returns a `{status: count}` summary.
+    """
+    if resume:
+        done = {
+            path
+            for path, record in read_batch_log(log_path).items()
+            if record.get("status") == "ok"
+        }
+        blend_files = [path for path in blend_files if path not in done]
+
+    summary = collections.Counter()
+    log_lock = threading.Lock()
+
+    def process(blend):
+        if stop_event is not None and stop_event.is_set():
+            return
+        command = build_worker_command(
+            command_template, blend, scripts, root, save=save, blender=blender
+        )
+        record = _run_worker(command, blend, timeout)
+        with log_lock:
+            with open(log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+            summary[record["status"]] += 1
+        if on_result is not None:
+            on_result(record)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for future in [pool.submit(process, blend) for blend in blend_files]:
+            future.result()
+    return dict(summary)
+
+
+def run_batch_worker(scripts, root, save=True):
+    """Worker side of a batch: run the scripts in the open file and save it."""
+    for script_path in scripts:
+        print(f"Running {script_path}")
+        script_globals = run_script_file(script_path, use_disk_cache=True, root=root)
+        main = get_script_main(script_globals)
+        for _ in main() if main else ():
+            pass
+    if save:
+        bpy.ops.wm.save_mainfile()
+
+
+class BatchRun:
+    """A batch started from the panel, running in a background thread."""
+
+    def __init__(self, blend_files, **options):
+        self.total = len(blend_files)
+        self.finished = 0
+        self.failed = 0
+        self.summary = None
+        self.error = ""
+        self.stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(blend_files,),
+            kwargs=options,
+            name="ScriptRunnerBatch",
+            daemon=True,
+        )
+
+    @property
+    def running(self):
+        return self._thread.is_alive()
+
+    def start(self):
+        self._thread.start()
+
+    def _on_result(self, record):
+        # Called from the pool's worker threads.
+        with self._lock:
+            self.finished += 1
+            if record["status"] != "ok":
+                self.failed += 1
+
+    def _run(self, blend_files, **options):
+        try:
+            self.summary = run_batch(
+                blend_files,
+                stop_event=self.stop_event,
+                on_result=self._on_result,
+                **options,
+            )
+        except Exception as e:
+            # E.g. the log file cannot be written: end the batch with an error
+            # instead of leaving the panel waiting for a summary.
+            self.error = str(e) or type(e).__name__
+            self.summary = {"error": self.total - self.finished}
+            print(f"Batch failed: {self.error}")
+
+
+active_batch = None
+
+
+def _poll_batch():
+    """Timer callback: redraw the panel while a batch is running."""
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == "VIEW_3D":
+                area.tag_redraw()
+    if active_batch is not None and active_batch.running:
+        return 0.5
+    return None
+
+
+def batch_main(argv):
+    """Command line entry point, see `--help`.
+
+    blender -b --factory-startup --python script_runner.py -- batch \\
+        --root scripts --blend-dir shots --script materials/a.py --workers 4
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="script_runner.py -- batch")
+    parser.add_argument("--root", required=True, help="Scripts folder")
+    parser.add_argument("--blend-dir", required=True, help="Folder with .blend files")
+    parser.add_argument(
+        "--script",
+        action="append",
+        required=True,
+        help="Script to run, relative to the scripts folder (repeat for a chain)",
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--timeout", type=float, default=600, help="Seconds per file")
+    parser.add_argument("--log", help="JSON-lines result log")
+    parser.add_argument("--resume", action="store_true", help="Skip files logged as ok")
+    parser.add_argument("--no-save", action="store_true", help="Do not save the files")
+    parser.add_argument("--recursive", action="store_true")
+    parser.add_argument("--worker-command", default=DEFAULT_WORKER_COMMAND)
+    args = parser.parse_args(argv)
+
+    root = os.path.abspath(args.root)
+    blend_dir = os.path.abspath(args.blend_dir)
+    blend_files = find_blend_files(blend_dir, args.recursive)
+    log_path = args.log or os.path.join(blend_dir, "script_runner_batch.jsonl")
+    print(f"Batch: {len(blend_files)} file(s), {args.workers} worker(s)")
+
+    def report(record):
+        print(f"[{record['status']}] {record['file']} ({record['duration']} s)")
+
+    summary = run_batch(
+        blend_files,
+        [os.path.join(root, script) for script in args.script],
+        root,
+        log_path,
+        workers=args.workers,
+        timeout=args.timeout,
+        save=not args.no_save,
+        resume=args.resume,
+        command_template=args.worker_command,
+        on_result=report,
+    )
+    print(f"Batch finished: {summary}, log: {log_path}")
+    return 0 if set(summary) <= {"ok"} else 1
+
+
+def worker_main(argv):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="script_runner.py -- worker")
+    parser.add_argument("--root", required=True)
+    parser.add_argument("--save", action="store_true", default=True)
+    parser.add_argument("--no-save", dest="save", action="store_false")
+    parser.add_argument("scripts", nargs="+")
+    args = parser.parse_args(argv)
+
+    run_batch_worker(args.scripts, args.root, save=args.save)
+    return 0
+
+
 # --- Callbacks to Populate Enums ---
 
 
 def get_script_categories(self, context):
-    base = self.folder_path
-    if os.path.isdir(base):
-        return [
-            (d, d, "")
-            for d in sorted(os.listdir(base))
-            if os.path.isdir(os.path.join(base, d))
-            and d not in SCRIPT_RUNNER_PN.IGNORED_FOLDERS
-        ]
-    return []
+    return script_index.categories(get_scripts_root(self))
 
 
 def get_scripts_in_category(self, context):
-    base = self.folder_path
-    cat = self.category
-    cat_path = os.path.join(base, cat) if cat else ""
-    if os.path.isdir(cat_path):
-        return [(f, f, "") for f in sorted(os.listdir(cat_path)) if f.endswith(".py")]
-    return []
+    return script_index.scripts(get_scripts_root(self), self.category)
 
 
 # --- Property Group ---
 
 
+class SCRIPT_RUNNER_PG_batch_script(PropertyGroup):
+    name: bpy.props.StringProperty(description="Script path relative to the scripts folder")
+
+
 class SCRIPT_RUNNER_PN(PropertyGroup):
     # Folders that should not appear in category list
     IGNORED_FOLDERS = {".git", "__pycache__", ".idea", ".vscode", "venv"}
@@ -89,6 +1564,7 @@ class SCRIPT_RUNNER_PN(PropertyGroup):
         description="Path to parent folder with categories",
         default="//scripts/",
         subtype="DIR_PATH",
+        update=lambda self, ctx: sync_folder_watcher(self),
     )
 
     category: bpy.props.EnumProperty(
@@ -103,36 +1579,545 @@ class SCRIPT_RUNNER_PN(PropertyGroup):
         items=lambda self, ctx: get_scripts_in_category(self, ctx),
     )
 
+    search: bpy.props.StringProperty(
+        name="",
+        description="Search scripts of all categories by name, title, docstring and constants",
+        options={"TEXTEDIT_UPDATE"},
+    )
+
+    cache_to_disk: bpy.props.BoolProperty(
+        name="Cache Compiled Scripts",
+        description=(
+            "Save compiled scripts to __pycache__ so later sessions "
+            "skip compiling unchanged scripts"
+        ),
+        default=True,
+    )
+
+    single_undo: bpy.props.BoolProperty(
+        name="Single Undo Step",
+        description=(
+            "Run each script as one undo step, so operators it calls do not "
+            "fill the undo stack"
+        ),
+        default=True,
+    )
+
+    chunk_size: bpy.props.IntProperty(
+        name="Chunk Size",
+        description="Default number of items per chunk for the `chunked` helper",
+        default=500,
+        min=1,
+    )
+
+    time_budget: bpy.props.FloatProperty(
+        name="Time Budget (s)",
+        description=(
+            "Abort a script that runs longer than this and roll back its "
+            "changes (0 = no limit). Scripts then always run as a single "
+            "undo step"
+        ),
+        default=0.0,
+        min=0.0,
+    )
+
+    non_blocking: bpy.props.BoolProperty(
+        name="Non-Blocking",
+        description=(
+            "Run scripts that define a generator function `main` in time "
+            "slices, keeping the UI responsive. Press Esc to cancel"
+        ),
+        default=False,
+    )
+
+    use_watcher: bpy.props.BoolProperty(
+        name="Watch Folder",
+        description="Refresh the category and script lists automatically when files change",
+        default=False,
+        update=lambda self, ctx: sync_folder_watcher(self),
+    )
+
+    watch_mode: bpy.props.EnumProperty(
+        name="Watch Mode",
+        description="How the scripts folder is watched",
+        items=[
+            ("AUTO", "Auto", "Use inotify where available, otherwise poll"),
+            ("POLL", "Poll", "Check folder timestamps periodically (works on network shares)"),
+        ],
+        default="AUTO",
+        update=lambda self, ctx: sync_folder_watcher(self),
+    )
+
+    watch_interval: bpy.props.FloatProperty(
+        name="Poll Interval",
+        description="Seconds between folder checks when polling",
+        default=2.0,
+        min=0.5,
+        max=60.0,
+        update=lambda self, ctx: sync_folder_watcher(self),
+    )
+
+    batch_folder: bpy.props.StringProperty(
+        name="Blend Files",
+        description="Folder with the .blend files to process",
+        subtype="DIR_PATH",
+    )
+
+    batch_scripts: bpy.props.CollectionProperty(type=SCRIPT_RUNNER_PG_batch_script)
+
+    batch_index: bpy.props.IntProperty()
+
+    batch_workers: bpy.props.IntProperty(
+        name="Workers",
+        description="Number of Blender processes running in parallel",
+        default=2,
+        min=1,
+        max=64,
+    )
+
+    batch_timeout: bpy.props.FloatProperty(
+        name="Timeout (s)",
+        description="Stop a worker that takes longer than this for one file",
+        default=600.0,
+        min=1.0,
+    )
+
+    batch_log: bpy.props.StringProperty(
+        name="Log",
+        description="JSON-lines result log (default: script_runner_batch.jsonl in the blend folder)",
+        subtype="FILE_PATH",
+    )
+
+    batch_resume: bpy.props.BoolProperty(
+        name="Resume",
+        description="Skip files the log already lists as processed",
+        default=True,
+    )
+
+    batch_save: bpy.props.BoolProperty(
+        name="Save Files",
+        description="Save each .blend file after the scripts ran",
+        default=True,
+    )
+
+    batch_recursive: bpy.props.BoolProperty(
+        name="Include Subfolders",
+        default=False,
+    )
+
+    profile_runs: bpy.props.BoolProperty(
+        name="Profile Runs",
+        description="Record a cProfile profile of every run (slows scripts down)",
+        default=False,
+    )
+
+    history_size: bpy.props.IntProperty(
+        name="History Size",
+        description="Number of runs kept in the history",
+        default=20,
+        min=1,
+        max=500,
+        update=lambda self, ctx: run_history.resize(self.history_size),
+    )
+
+    time_slice: bpy.props.IntProperty(
+        name="Time Slice (ms)",
+        description="How long a non-blocking script runs before the UI gets control back",
+        default=30,
+        min=5,
+        max=1000,
+    )
+
 
 # --- Script Runner Operator ---
 
 
-class SCRIPT_RUNNER_OT_run_script(Operator):
-    bl_idname = "wm.run_selected_script"
-    bl_label = "Run Selected Script"
+class RunScriptMixin:
+    """Shared implementation of the run operators."""
+
+    filepath: bpy.props.StringProperty(
+        description="Script to run instead of the selected one (category/script.py)",
+        options={"HIDDEN", "SKIP_SAVE"},
+    )
+
+    _timer = None
+    _steps = None
+
+    def _start(self, context):
+        """Run the selected script's top-level code.
+
+        Returns the `main` generator of the script (or None) on success and
+        a status set when the run is already over.
+        """
+        global active_run
 
-    def execute(self, context):
         props = context.scene.script_runner_props
-        folder = props.folder_path
+        folder = get_scripts_root(props)
         cat = props.category
         script = props.script_files
+        if self.filepath:
+            cat, _, script = self.filepath.partition("/")
+
+        if active_run is not None:
+            self.report({"ERROR"}, f"Already running {active_run.label}.")
+            return {"CANCELLED"}
 
         if not (folder and cat and script):
             self.report({"ERROR"}, "Category or script not selected.")
             return {"CANCELLED"}
 
         script_path = os.path.join(folder, cat, script)
+        active_run = ScriptRun(
+            f"{cat}/{script}",
+            profile=props.profile_runs,
+            chunk_size=props.chunk_size,
+        )
+        if props.time_budget > 0:
+            if "UNDO" in self.bl_options:
+                # Undo step to roll back to if the watchdog has to abort the run.
+                bpy.ops.ed.undo_push(message=f"Before {active_run.label}")
+            active_run.watchdog = Watchdog(props.time_budget, folder)
+        context.window_manager.progress_begin(0, 100)
         try:
-            with open(script_path, "r") as f:
-                exec(compile(f.read(), script_path, "exec"), {"__name__": "__main__"})
-            self.report({"INFO"}, f"Ran script: {cat}/{script}")
-        except Exception as e:
-            self.report({"ERROR"}, f"Error running {script}: {e}")
+            with active_run.measure():
+                script_globals = run_script_file(
+                    script_path, props.cache_to_disk, root=folder
+                )
+            main = get_script_main(script_globals)
+            return main() if main else None
+        except (Exception, ScriptTimeout) as e:
+            return self._finish(context, e)
+
+    def _finish(self, context, error=None):
+        global active_run
+
+        run = active_run
+        label = run.label
+        active_run = None
+        if run.watchdog is not None:
+            run.watchdog.stop()
+        context.window_manager.progress_end()
+        if self._timer is not None:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
+        if context.workspace is not None:
+            context.workspace.status_text_set(None)
+        _tag_redraw_panels(context)
+
+        if error is None:
+            record = run_history.add(run, "FINISHED")
+            self.report({"INFO"}, f"Ran script: {label} ({record.duration:.3f} s)")
+            return {"FINISHED"}
+        if isinstance(error, ScriptTimeout):
+            watchdog = run.watchdog
+            message = (
+                f"Time budget of {watchdog.budget:g} s exceeded, "
+                f"stuck at {watchdog.location or 'unknown location'}"
+            )
+            run_history.add(run, "TIMEOUT", message)
+            if "UNDO" not in self.bl_options:
+                # Operators the script called pushed their own undo steps
+                # after "Before ...", so one undo would not get back there.
+                self.report(
+                    {"ERROR"},
+                    f"Aborted {label}: {message}. Changes were not rolled back.",
+                )
+                return {"CANCELLED"}
+            self.report({"ERROR"}, f"Aborted {label}: {message}. Changes rolled back.")
+            _rollback_aborted_run(label)
+            return {"CANCELLED"}
+        if isinstance(error, ScriptCancelled):
+            run_history.add(run, "CANCELLED")
+            self.report({"WARNING"}, f"Cancelled script: {label}")
+        else:
+            run_history.add(run, "ERROR", str(error))
+            self.report({"ERROR"}, f"Error running {label}: {error}")
+        if "UNDO" in self.bl_options:
+            # Finishing still pushes the single undo step, so whatever the
+            # script changed before it stopped can be undone at once.
+            return {"FINISHED"}
+        return {"CANCELLED"}
+
+    def execute(self, context):
+        steps = self._start(context)
+        if isinstance(steps, set):
+            return steps
+        try:
+            with active_run.measure():
+                for _ in steps or ():
+                    pass
+        except (Exception, ScriptTimeout) as e:
+            return self._finish(context, e)
+        return self._finish(context)
+
+    def invoke(self, context, event):
+        props = context.scene.script_runner_props
+        if not props.non_blocking:
+            return self.execute(context)
+
+        steps = self._start(context)
+        if isinstance(steps, set):
+            return steps
+        if steps is None:
+            return self._finish(context)
+
+        self._steps = steps
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.001, window=context.window)
+        wm.modal_handler_add(self)
+        return {"RUNNING_MODAL"}
+
+    def modal(self, context, event):
+        run = active_run
+        if (event.type == "ESC" and event.value == "PRESS") or run.cancel_requested:
+            self._steps.close()
+            return self._finish(context, ScriptCancelled())
+
+        if event.type != "TIMER" or event.timer is not self._timer:
+            return {"PASS_THROUGH"}
+
+        if run.watchdog is not None and run.watchdog.expired:
+            self._steps.close()
+            return self._finish(context, ScriptTimeout())
+
+        props = context.scene.script_runner_props
+        deadline = time.perf_counter() + props.time_slice / 1000
+        try:
+            with run.measure():
+                while time.perf_counter() < deadline:
+                    next(self._steps)
+        except StopIteration:
+            return self._finish(context)
+        except (Exception, ScriptTimeout) as e:
+            return self._finish(context, e)
+
+        if context.workspace is not None:
+            context.workspace.status_text_set(f"{run.status_text()} (Esc to cancel)")
+        _tag_redraw_panels(context)
+        return {"RUNNING_MODAL"}
+
+
+class SCRIPT_RUNNER_OT_run_script(RunScriptMixin, Operator):
+    bl_idname = "wm.run_selected_script"
+    bl_label = "Run Selected Script"
+    bl_options = {"REGISTER"}
+
+
+# Operators called by the script do not push undo steps of their own while an
+# undo operator runs, and Blender pushes exactly one step when it ends.
+class SCRIPT_RUNNER_OT_run_script_undo(RunScriptMixin, Operator):
+    bl_idname = "wm.run_selected_script_undo"
+    bl_label = "Run Selected Script"
+    bl_description = "Run the selected script as a single undo step"
+    bl_options = {"REGISTER", "UNDO"}
+
+
+def run_operator_idname(props):
+    """Id of the run operator matching the undo option.
+
+    With a time budget the single-step variant is always used: operators
+    called by the script then push no steps after "Before ...", so one
+    undo after an abort returns exactly to the state before the run.
+    """
+    if props.single_undo or props.time_budget > 0:
+        return SCRIPT_RUNNER_OT_run_script_undo.bl_idname
+    return SCRIPT_RUNNER_OT_run_script.bl_idname
+
+
+class SCRIPT_RUNNER_OT_select_script(Operator):
+    bl_idname = "wm.select_script"
+    bl_label = "Select Script"
+    bl_description = "Select this script in the category and script lists"
+
+    filepath: bpy.props.StringProperty(options={"HIDDEN", "SKIP_SAVE"})
+
+    def execute(self, context):
+        props = context.scene.script_runner_props
+        cat, _, script = self.filepath.partition("/")
+        props.category = cat
+        props.script_files = script
+        props.search = ""
+        return {"FINISHED"}
+
+
+class SCRIPT_RUNNER_OT_cancel_run(Operator):
+    bl_idname = "wm.cancel_script_run"
+    bl_label = "Cancel"
+    bl_description = "Stop the running script at its next yield point"
+
+    @classmethod
+    def poll(cls, context):
+        return active_run is not None
+
+    # noinspection PyMethodMayBeStatic
+    def execute(self, context):
+        active_run.cancel_requested = True
+        return {"FINISHED"}
+
+
+class SCRIPT_RUNNER_OT_select_run(Operator):
+    bl_idname = "wm.select_script_run"
+    bl_label = "Select Run"
+    bl_description = "Show the details of this run"
+
+    run_id: bpy.props.IntProperty()
+
+    def execute(self, context):
+        run_history.selected_id = self.run_id
+        return {"FINISHED"}
+
+
+class SCRIPT_RUNNER_OT_clear_history(Operator):
+    bl_idname = "wm.clear_script_history"
+    bl_label = "Clear History"
+    bl_description = "Forget all recorded script runs"
+
+    # noinspection PyMethodMayBeStatic
+    def execute(self, context):
+        run_history.clear()
+        return {"FINISHED"}
+
+
+class SCRIPT_RUNNER_OT_export_profile(Operator, ExportHelper):
+    bl_idname = "wm.export_script_profile"
+    bl_label = "Export Profile"
+    bl_description = "Save the profile of the selected run as a .pstats file"
+
+    filename_ext = ".pstats"
+    filter_glob: bpy.props.StringProperty(default="*.pstats", options={"HIDDEN"})
+
+    @classmethod
+    def poll(cls, context):
+        record = run_history.selected()
+        return record is not None and record.stats is not None
+
+    def execute(self, context):
+        run_history.selected().stats.dump_stats(self.filepath)
+        self.report({"INFO"}, f"Profile saved to: {self.filepath}")
+        return {"FINISHED"}
+
+
+# --- Batch Operators ---
+
+
+class SCRIPT_RUNNER_UL_batch_scripts(UIList):
+    # noinspection PyMethodMayBeStatic
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname):
+        layout.label(text=item.name, icon="FILE_SCRIPT")
+
+
+class SCRIPT_RUNNER_OT_batch_add_script(Operator):
+    bl_idname = "wm.batch_add_script"
+    bl_label = "Add Script"
+    bl_description = "Append the selected script to the batch chain"
+
+    def execute(self, context):
+        props = context.scene.script_runner_props
+        if not (props.category and props.script_files):
+            self.report({"ERROR"}, "Category or script not selected.")
+            return {"CANCELLED"}
+        item = props.batch_scripts.add()
+        item.name = f"{props.category}/{props.script_files}"
+        props.batch_index = len(props.batch_scripts) - 1
+        return {"FINISHED"}
+
+
+class SCRIPT_RUNNER_OT_batch_remove_script(Operator):
+    bl_idname = "wm.batch_remove_script"
+    bl_label = "Remove Script"
+    bl_description = "Remove the active script from the batch chain"
+
+    def execute(self, context):
+        props = context.scene.script_runner_props
+        if 0 <= props.batch_index < len(props.batch_scripts):
+            props.batch_scripts.remove(props.batch_index)
+            props.batch_index = min(props.batch_index, len(props.batch_scripts) - 1)
+        return {"FINISHED"}
+
+
+class SCRIPT_RUNNER_OT_batch_move_script(Operator):
+    bl_idname = "wm.batch_move_script"
+    bl_label = "Move Script"
+    bl_description = "Move the active script up or down in the batch chain"
+
+    direction: bpy.props.EnumProperty(items=[("UP", "Up", ""), ("DOWN", "Down", "")])
+
+    def execute(self, context):
+        props = context.scene.script_runner_props
+        index = props.batch_index
+        target = index - 1 if self.direction == "UP" else index + 1
+        if 0 <= index < len(props.batch_scripts) and 0 <= target < len(props.batch_scripts):
+            props.batch_scripts.move(index, target)
+            props.batch_index = target
+        return {"FINISHED"}
+
+
+class SCRIPT_RUNNER_OT_run_batch(Operator):
+    bl_idname = "wm.run_script_batch"
+    bl_label = "Run Batch"
+    bl_description = "Run the script chain over every .blend file in the folder"
+
+    @classmethod
+    def poll(cls, context):
+        return active_batch is None or not active_batch.running
+
+    def execute(self, context):
+        global active_batch
+
+        props = context.scene.script_runner_props
+        root = get_scripts_root(props)
+        blend_dir = bpy.path.abspath(props.batch_folder)
+        if not os.path.isdir(blend_dir):
+            self.report({"ERROR"}, "Choose a folder with .blend files.")
+            return {"CANCELLED"}
+        if not props.batch_scripts:
+            self.report({"ERROR"}, "Add at least one script to the chain.")
             return {"CANCELLED"}
 
+        blend_files = find_blend_files(blend_dir, props.batch_recursive)
+        log_path = bpy.path.abspath(props.batch_log) or os.path.join(
+            blend_dir, "script_runner_batch.jsonl"
+        )
+        active_batch = BatchRun(
+            blend_files,
+            scripts=[os.path.join(root, item.name) for item in props.batch_scripts],
+            root=root,
+            log_path=log_path,
+            workers=props.batch_workers,
+            timeout=props.batch_timeout,
+            save=props.batch_save,
+            resume=props.batch_resume,
+        )
+        active_batch.start()
+        bpy.app.timers.register(_poll_batch, first_interval=0.5)
+        self.report({"INFO"}, f"Batch started: {len(blend_files)} file(s), log: {log_path}")
+        return {"FINISHED"}
+
+
+class SCRIPT_RUNNER_OT_cancel_batch(Operator):
+    bl_idname = "wm.cancel_script_batch"
+    bl_label = "Cancel Batch"
+    bl_description = "Do not start any more files (running workers finish)"
+
+    @classmethod
+    def poll(cls, context):
+        return active_batch is not None and active_batch.running
+
+    # noinspection PyMethodMayBeStatic
+    def execute(self, context):
+        active_batch.stop_event.set()
         return {"FINISHED"}
 
 
+def _tag_redraw_panels(context):
+    screen = context.screen
+    if screen is None:
+        return
+    for area in screen.areas:
+        if area.type == "VIEW_3D":
+            area.tag_redraw()
+
+
 # --- Refresh Operator (Manual Update) ---
 
 
@@ -144,6 +2129,9 @@ class SCRIPT_RUNNER_OT_update_script_list(Operator):
 
     # noinspection PyMethodMayBeStatic
     def execute(self, context):
+        script_index.clear()
+        metadata_index.invalidate()
+        helper_modules.purge()
         context.area.tag_redraw()
         return {"FINISHED"}
 
@@ -205,21 +2193,222 @@ class SCRIPT_RUNNER_PT_panel(Panel):
         row.operator(SCRIPT_RUNNER_OT_toggle_terminal.bl_idname, text="", icon="CONSOLE")
         row.operator(SCRIPT_RUNNER_OT_update_script_list.bl_idname,text="", icon="FILE_REFRESH")
 
+        layout.prop(props, "search", icon="VIEWZOOM")
+        if props.search.strip():
+            self.draw_search_results(layout, props)
+            return
+
         layout.prop(props, "category")
         row = layout.row()
-        if props.category:
+        if active_run is not None:
+            self.draw_progress(layout)
+        elif props.category:
             row.prop(props, "script_files")
-            row.operator(SCRIPT_RUNNER_OT_run_script.bl_idname, text="", icon="PLAY")
+            row.operator(run_operator_idname(props), text="", icon="PLAY")
         else:
             row.label(text="Select a category", icon="INFO")
 
+    @staticmethod
+    def draw_search_results(layout, props):
+        results = metadata_index.search(get_scripts_root(props), props.search)
+        if not results:
+            layout.label(text="No matching scripts", icon="INFO")
+            return
+
+        col = layout.column(align=True)
+        for name, title in results:
+            row = col.row(align=True)
+            row.operator(
+                SCRIPT_RUNNER_OT_select_script.bl_idname, text=name, emboss=False
+            ).filepath = name
+            if active_run is None:
+                row.operator(
+                    run_operator_idname(props), text="", icon="PLAY"
+                ).filepath = name
+            if title:
+                sub = col.row()
+                sub.enabled = False
+                sub.label(text=title)
+
+    @staticmethod
+    def draw_progress(layout):
+        run = active_run
+        row = layout.row(align=True)
+        if hasattr(row, "progress"):
+            row.progress(factor=run.factor, text=run.status_text())
+        else:
+            row.label(text=run.status_text(), icon="TIME")
+        row.operator(SCRIPT_RUNNER_OT_cancel_run.bl_idname, text="", icon="CANCEL")
+
+
+class SCRIPT_RUNNER_PT_options(Panel):
+    bl_label = "Options"
+    bl_idname = "SCENE_PT_script_runner_options"
+    bl_parent_id = SCRIPT_RUNNER_PT_panel.bl_idname
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "DEV"
+    bl_options = {"DEFAULT_CLOSED"}
+
+    def draw(self, context):
+        layout = self.layout
+        props = context.scene.script_runner_props
+
+        layout.prop(props, "cache_to_disk")
+        layout.prop(props, "use_watcher")
+        sub = layout.column()
+        sub.active = props.use_watcher
+        sub.prop(props, "watch_mode")
+        sub.prop(props, "watch_interval")
+        layout.prop(props, "single_undo")
+        layout.prop(props, "chunk_size")
+        layout.prop(props, "time_budget")
+        layout.prop(props, "non_blocking")
+        sub = layout.row()
+        sub.active = props.non_blocking
+        sub.prop(props, "time_slice")
+        layout.prop(props, "profile_runs")
+        layout.prop(props, "history_size")
+
+
+class SCRIPT_RUNNER_PT_history(Panel):
+    bl_label = "History"
+    bl_idname = "SCENE_PT_script_runner_history"
+    bl_parent_id = SCRIPT_RUNNER_PT_panel.bl_idname
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "DEV"
+    bl_options = {"DEFAULT_CLOSED"}
+
+    def draw_header_preset(self, context):
+        self.layout.operator(
+            SCRIPT_RUNNER_OT_clear_history.bl_idname, text="", icon="TRASH", emboss=False
+        )
+
+    def draw(self, context):
+        layout = self.layout
+        if not run_history.runs:
+            layout.label(text="No runs yet")
+            return
+
+        col = layout.column(align=True)
+        for record in run_history.runs:
+            op = col.operator(
+                SCRIPT_RUNNER_OT_select_run.bl_idname,
+                text=f"{record.label}  {record.duration:.3f} s",
+                icon=record.icon,
+                depress=record.run_id == run_history.selected_id,
+            )
+            op.run_id = record.run_id
+
+        record = run_history.selected()
+        if record is None:
+            return
+
+        box = layout.box()
+        if record.message:
+            box.label(text=record.message, icon="ERROR")
+        if record.stats is None:
+            box.label(text="Enable 'Profile Runs' to see hot functions", icon="INFO")
+            return
+
+        box.label(text="Hot functions (own / cumulative time):")
+        col = box.column(align=True)
+        for func, calls, own, cumulative in record.hot_functions():
+            row = col.row()
+            row.label(text=func)
+            row.label(
+                text=f"{own * 1000:.1f} / {cumulative * 1000:.1f} ms, {calls}x"
+            )
+        box.operator(SCRIPT_RUNNER_OT_export_profile.bl_idname, icon="EXPORT")
+
+
+class SCRIPT_RUNNER_PT_batch(Panel):
+    bl_label = "Batch"
+    bl_idname = "SCENE_PT_script_runner_batch"
+    bl_parent_id = SCRIPT_RUNNER_PT_panel.bl_idname
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "DEV"
+    bl_options = {"DEFAULT_CLOSED"}
+
+    def draw(self, context):
+        layout = self.layout
+        props = context.scene.script_runner_props
+
+        layout.prop(props, "batch_folder")
+        row = layout.row()
+        row.template_list(
+            "SCRIPT_RUNNER_UL_batch_scripts",
+            "",
+            props,
+            "batch_scripts",
+            props,
+            "batch_index",
+            rows=3,
+        )
+        col = row.column(align=True)
+        col.operator(SCRIPT_RUNNER_OT_batch_add_script.bl_idname, text="", icon="ADD")
+        col.operator(SCRIPT_RUNNER_OT_batch_remove_script.bl_idname, text="", icon="REMOVE")
+        col.separator()
+        col.operator(
+            SCRIPT_RUNNER_OT_batch_move_script.bl_idname, text="", icon="TRIA_UP"
+        ).direction = "UP"
+        col.operator(
+            SCRIPT_RUNNER_OT_batch_move_script.bl_idname, text="", icon="TRIA_DOWN"
+        ).direction = "DOWN"
+
+        col = layout.column()
+        col.prop(props, "batch_workers")
+        col.prop(props, "batch_timeout")
+        col.prop(props, "batch_log")
+        row = col.row()
+        row.prop(props, "batch_resume")
+        row.prop(props, "batch_save")
+        col.prop(props, "batch_recursive")
+
+        batch = active_batch
+        if batch is not None and batch.running:
+            row = layout.row(align=True)
+            text = f"{batch.finished}/{batch.total} files, {batch.failed} failed"
+            if hasattr(row, "progress"):
+                row.progress(factor=batch.finished / max(batch.total, 1), text=text)
+            else:
+                row.label(text=text, icon="TIME")
+            row.operator(SCRIPT_RUNNER_OT_cancel_batch.bl_idname, text="", icon="CANCEL")
+        else:
+            layout.operator(SCRIPT_RUNNER_OT_run_batch.bl_idname, icon="PLAY")
+            if batch is not None and batch.error:
+                layout.label(text=f"Last batch failed: {batch.error}", icon="ERROR")
+            elif batch is not None and batch.summary is not None:
+                layout.label(
+                    text=f"Last batch: {batch.finished} file(s), {batch.failed} failed",
+                    icon="ERROR" if batch.failed else "CHECKMARK",
+                )
+
 
 # --- Registration ---
 
 classes = (
+    SCRIPT_RUNNER_PG_batch_script,
     SCRIPT_RUNNER_PN,
     SCRIPT_RUNNER_PT_panel,
+    SCRIPT_RUNNER_PT_options,
+    SCRIPT_RUNNER_PT_history,
+    SCRIPT_RUNNER_PT_batch,
+    SCRIPT_RUNNER_UL_batch_scripts,
     SCRIPT_RUNNER_OT_run_script,
+    SCRIPT_RUNNER_OT_run_script_undo,
+    SCRIPT_RUNNER_OT_select_script,
+    SCRIPT_RUNNER_OT_cancel_run,
+    SCRIPT_RUNNER_OT_select_run,
+    SCRIPT_RUNNER_OT_clear_history,
+    SCRIPT_RUNNER_OT_export_profile,
+    SCRIPT_RUNNER_OT_batch_add_script,
+    SCRIPT_RUNNER_OT_batch_remove_script,
+    SCRIPT_RUNNER_OT_batch_move_script,
+    SCRIPT_RUNNER_OT_run_batch,
+    SCRIPT_RUNNER_OT_cancel_batch,
     SCRIPT_RUNNER_OT_set_folder,
     SCRIPT_RUNNER_OT_update_script_list,
 )
@@ -231,13 +2420,28 @@ def register():
     bpy.types.Scene.script_runner_props = bpy.props.PointerProperty(
         type=SCRIPT_RUNNER_PN
     )
+    bpy.app.handlers.load_post.append(_sync_folder_watcher_on_load)
+    bpy.app.timers.register(_sync_folder_watcher_on_register, first_interval=0.1)
 
 
 def unregister():
+    if _sync_folder_watcher_on_load in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_sync_folder_watcher_on_load)
+    if bpy.app.timers.is_registered(_sync_folder_watcher_on_register):
+        bpy.app.timers.unregister(_sync_folder_watcher_on_register)
+    stop_folder_watcher()
+    if active_batch is not None:
+        active_batch.stop_event.set()
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
     del bpy.types.Scene.script_runner_props
 
 
 if __name__ == "__main__":
-    register()
+    cli_args = sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else []
+    if cli_args[:1] == ["batch"]:
+        sys.exit(batch_main(cli_args[1:]))
+    elif cli_args[:1] == ["worker"]:
+        sys.exit(worker_main(cli_args[1:]))
+    else:
+        register()